@@ -6,49 +6,152 @@ Administrative endpoints for configuring seasons, clubs, teams, and players.
 Only accessible to users with admin role.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Callable, List, Optional, Dict
 from datetime import datetime
-from jose import jwt
+from collections import OrderedDict
+import jwt
+from sqlalchemy import delete, func, select, update as sql_update
 from sqlalchemy.orm import Session
+import asyncio
+import hashlib
+import orjson
 import os
+import threading
+import time
 
 from database import get_db
-from database_models import Season, Club, Team, Player, User, League, FantasyTeam
+from database_models import (
+    Season, Club, Team, Player, User, League, LeagueRoster,
+    FantasyTeam, FantasyTeamPlayer, Transfer
+)
 from season_setup_service import SeasonSetupService
 
-# Router for admin endpoints
-router = APIRouter(prefix="/api/admin", tags=["admin"])
+# Router for admin endpoints. Handlers that use the (synchronous) database
+# session are plain `def` so FastAPI runs them in its threadpool instead of
+# blocking the event loop.
+router = APIRouter(prefix="/api/admin", tags=["admin"], default_response_class=ORJSONResponse)
 security = HTTPBearer()
 
 # Environment variables
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
+JWT_ALGORITHMS = ["HS256"]
+JWT_DECODE_OPTIONS = {"require": ["sub", "exp"]}
+
+# Verified admin tokens: token digest -> (cache expiry timestamp, admin data).
+# Keyed by a BLAKE2b digest so raw bearer tokens aren't kept in memory.
+ADMIN_TOKEN_CACHE_SIZE = 1024
+ADMIN_TOKEN_CACHE_TTL = 30  # seconds
+_admin_token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_admin_token(token: str):
+    """Forget a cached admin verification (e.g. on logout)"""
+    _admin_token_cache.pop(_token_cache_key(token), None)
+
+# Read-mostly admin responses polled by the dashboard: key -> (expiry, payload).
+# Per process, so other workers may serve a stale copy for up to the TTL.
+ADMIN_RESPONSE_CACHE_TTL = 30  # seconds
+_admin_response_cache: Dict[str, tuple] = {}
+
+# Rows fetched per round trip when streaming large lists (players, users)
+STREAM_BATCH_SIZE = 500
+
+
+def _get_cached_response(key: str):
+    """Return the cached payload for key, or None if missing or expired"""
+    cached = _admin_response_cache.get(key)
+    if cached and cached[0] > time.time():
+        return cached[1]
+    return None
+
+
+def _cache_response(key: str, payload):
+    """Cache a payload for ADMIN_RESPONSE_CACHE_TTL seconds and return it"""
+    _admin_response_cache[key] = (time.time() + ADMIN_RESPONSE_CACHE_TTL, payload)
+    return payload
+
+
+def invalidate_admin_cache():
+    """Drop all cached admin responses (call after changing seasons/templates)"""
+    _admin_response_cache.clear()
+
+# Encoded club player lists, LRU: (players version, club_id, filters...) ->
+# (expiry, body). A player write bumps the version so existing entries stop
+# matching and age out; writes made by other workers or Celery show up
+# within the TTL.
+PLAYER_LIST_CACHE_SIZE = 64
+_player_list_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_players_version = 0
+# Handlers and the streaming on_complete callback run on threadpool threads
+_player_list_lock = threading.Lock()
+
+
+def invalidate_player_cache():
+    """Invalidate cached player lists and club counts (call after any player write)"""
+    global _players_version
+    with _player_list_lock:
+        _players_version += 1
+    _admin_response_cache.pop("clubs", None)
+
+
+def _get_cached_player_list(key: tuple) -> Optional[bytes]:
+    with _player_list_lock:
+        cached = _player_list_cache.get(key)
+        if cached and cached[0] > time.time():
+            _player_list_cache.move_to_end(key)
+            return cached[1]
+    return None
+
+
+def _cache_player_list(key: tuple, body: bytes):
+    with _player_list_lock:
+        _player_list_cache[key] = (time.time() + ADMIN_RESPONSE_CACHE_TTL, body)
+        _player_list_cache.move_to_end(key)
+        if len(_player_list_cache) > PLAYER_LIST_CACHE_SIZE:
+            _player_list_cache.popitem(last=False)
 
 # =============================================================================
 # PYDANTIC MODELS FOR ADMIN OPERATIONS
 # =============================================================================
 
-class SeasonCreate(BaseModel):
+class AdminRequest(BaseModel):
+    """
+    Base for admin request bodies
+
+    Bodies are validated once and only read afterwards, so they're frozen,
+    and unknown fields are ignored rather than collected.
+    """
+    class Config:
+        frozen = True
+        extra = "ignore"
+
+class SeasonCreate(AdminRequest):
     """Create a new season"""
     year: str = Field(..., example="2026")
     name: str = Field(..., example="Topklasse 2026")
-    start_date: str = Field(..., example="2026-04-01")
-    end_date: str = Field(..., example="2026-09-30")
+    start_date: datetime = Field(..., example="2026-04-01")
+    end_date: datetime = Field(..., example="2026-09-30")
     description: Optional[str] = None
     is_active: bool = True
 
-class SeasonUpdate(BaseModel):
+class SeasonUpdate(AdminRequest):
     """Update season settings"""
     name: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
     registration_open: Optional[bool] = None
 
-class ClubCreate(BaseModel):
+class ClubCreate(AdminRequest):
     """Create a new club"""
     season_id: Optional[str] = Field(None, description="Season ID this club belongs to")
     name: str = Field(..., example="ACC")
@@ -56,20 +159,20 @@ class ClubCreate(BaseModel):
     location: Optional[str] = Field(None, example="Amsterdam")
     founded_year: Optional[int] = Field(None, example=1921)
 
-class TeamCreate(BaseModel):
+class TeamCreate(AdminRequest):
     """Create a team within a club"""
     name: str = Field(..., example="ACC 1")
     level: str = Field(..., example="1st")
     tier_type: str = Field(default="senior", example="senior")
     multiplier: float = Field(default=1.0, example=1.2)
 
-class PlayerValueUpdate(BaseModel):
+class PlayerValueUpdate(AdminRequest):
     """Update player value"""
     player_id: str
     new_value: float = Field(..., ge=1.0, le=100.0)
     reason: Optional[str] = None
 
-class LeagueTemplate(BaseModel):
+class LeagueTemplate(AdminRequest):
     """League configuration template"""
     name: str = Field(..., example="Standard League")
     squad_size: int = Field(default=11, ge=11, le=15, description="Team size (11 players)")
@@ -79,14 +182,116 @@ class LeagueTemplate(BaseModel):
     max_players_per_team: int = Field(default=2, description="Maximum players from any team")
     require_from_each_team: bool = Field(default=True, description="Require 1 from all 10 teams")
 
+# =============================================================================
+# RESPONSE MODELS
+# =============================================================================
+
+class SeasonSummary(BaseModel):
+    """Season row in the admin season list"""
+    id: str
+    year: str
+    name: str
+    is_active: Optional[bool] = None
+    registration_open: Optional[bool] = None
+    start_date: datetime
+    end_date: datetime
+    description: Optional[str] = None
+    clubs_count: int
+    created_at: Optional[datetime] = None
+
+class SeasonList(BaseModel):
+    seasons: List[SeasonSummary]
+
+class ClubSummary(BaseModel):
+    """Club row in the admin club list"""
+    id: str
+    name: str
+    tier: str
+    location: Optional[str] = None
+    founded_year: Optional[int] = None
+    season_id: Optional[str] = None
+    teams_count: int
+    players_count: int
+
+class ClubList(BaseModel):
+    clubs: List[ClubSummary]
+
+# Built once at import; validate_python/dump_json then run entirely in
+# pydantic-core for the fixed-shape list responses
+_season_list_adapter = TypeAdapter(SeasonList)
+_club_list_adapter = TypeAdapter(ClubList)
+
+
+def _json_response(adapter: TypeAdapter, payload: dict) -> Response:
+    """Validate payload against adapter's model and return it as JSON"""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(payload)),
+        media_type="application/json"
+    )
+
+
+def _stream_json(
+    head: dict,
+    key: str,
+    rows,
+    on_complete: Optional[Callable[[bytes], None]] = None
+) -> StreamingResponse:
+    """
+    Stream {**head, key: [rows...]} as one JSON object
+
+    rows should be a result fetched with yield_per; each row mapping is
+    encoded with orjson as it arrives, so memory stays flat however many
+    rows there are. The request's session stays open until the response
+    has been sent. If on_complete is given it receives the full body once
+    the last chunk has been produced (used to cache the response).
+    """
+    def chunks():
+        yield orjson.dumps(head)[:-1] + (b"," if head else b"")
+        yield orjson.dumps(key) + b":["
+        for i, row in enumerate(rows):
+            if i:
+                yield b","
+            yield orjson.dumps(dict(row))
+        yield b"]}"
+
+    def body():
+        if on_complete is None:
+            yield from chunks()
+            return
+        sent = []
+        for chunk in chunks():
+            sent.append(chunk)
+            yield chunk
+        on_complete(b"".join(sent))
+
+    return StreamingResponse(body(), media_type="application/json")
+
 # =============================================================================
 # AUTHENTICATION & AUTHORIZATION
 # =============================================================================
 
 async def verify_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Verify that the user has admin privileges"""
+    """
+    Verify that the user has admin privileges
+
+    Successful verifications are cached per token for a short TTL (never
+    beyond the token's own expiry), so an admin page firing many requests
+    decodes its token once.
+    """
+    token = credentials.credentials
+    cache_key = _token_cache_key(token)
+    now = time.time()
+
+    cached = _admin_token_cache.get(cache_key)
+    if cached and cached[0] > now:
+        _admin_token_cache.move_to_end(cache_key)
+        return cached[1]
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=["HS256"])
+        # Cache misses verify off the event loop; hits above stay inline
+        payload = await asyncio.to_thread(
+            jwt.decode, token, SECRET_KEY, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS
+        )
         user_id = payload.get("sub")
         is_admin = payload.get("is_admin", False)
 
@@ -102,20 +307,39 @@ async def verify_admin(credentials: HTTPAuthorizationCredentials = Depends(secur
                 detail="Admin privileges required"
             )
 
-        return {"user_id": user_id, "is_admin": is_admin}
+        admin_data = {"user_id": user_id, "is_admin": is_admin}
+
+        expires_at = now + ADMIN_TOKEN_CACHE_TTL
+        if payload.get("exp"):
+            expires_at = min(expires_at, payload["exp"])
 
-    except jwt.JWTError:
+        _admin_token_cache[cache_key] = (expires_at, admin_data)
+        if len(_admin_token_cache) > ADMIN_TOKEN_CACHE_SIZE:
+            _admin_token_cache.popitem(last=False)
+
+        return admin_data
+
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
         )
 
+async def value_error_handler(request: Request, exc: ValueError):
+    """
+    Turn ValueErrors raised by endpoints or services into 400 responses
+
+    Registered on the app in main.py; the database session is rolled back
+    by get_db before this runs.
+    """
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_400_BAD_REQUEST)
+
 # =============================================================================
 # SEASON MANAGEMENT ENDPOINTS
 # =============================================================================
 
 @router.post("/seasons", status_code=status.HTTP_201_CREATED)
-async def create_season(
+def create_season(
     season: SeasonCreate,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -126,83 +350,112 @@ async def create_season(
     Creates a new cricket season with configuration settings.
     Only one season can be active at a time.
     """
-    try:
-        service = SeasonSetupService(db)
+    service = SeasonSetupService(db)
 
-        # Parse dates
-        start_date = datetime.fromisoformat(season.start_date)
-        end_date = datetime.fromisoformat(season.end_date)
-
-        # Create season
-        created_season = service.create_season(
-            year=season.year,
-            name=season.name,
-            start_date=start_date,
-            end_date=end_date,
-            description=season.description,
-            created_by=admin["user_id"],
-            activate=season.is_active
-        )
+    # Create season
+    created_season = service.create_season(
+        year=season.year,
+        name=season.name,
+        start_date=season.start_date,
+        end_date=season.end_date,
+        description=season.description,
+        created_by=admin["user_id"],
+        activate=season.is_active
+    )
 
-        db.commit()
+    db.commit()
+    invalidate_admin_cache()
 
-        return {
-            "message": "Season created successfully",
-            "season": {
-                "id": created_season.id,
-                "year": created_season.year,
-                "name": created_season.name,
-                "is_active": created_season.is_active,
-                "start_date": created_season.start_date.isoformat(),
-                "end_date": created_season.end_date.isoformat()
-            }
+    return {
+        "message": "Season created successfully",
+        "season": {
+            "id": created_season.id,
+            "year": created_season.year,
+            "name": created_season.name,
+            "is_active": created_season.is_active,
+            "start_date": created_season.start_date,
+            "end_date": created_season.end_date
         }
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to create season: {str(e)}")
+    }
 
 @router.get("/seasons")
-async def list_seasons(
+def list_seasons(
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """List all seasons (Admin only)"""
-    seasons = db.query(Season).order_by(Season.year.desc()).all()
-
-    return {
-        "seasons": [
-            {
-                "id": s.id,
-                "year": s.year,
-                "name": s.name,
-                "is_active": s.is_active,
-                "registration_open": s.registration_open,
-                "start_date": s.start_date.isoformat(),
-                "end_date": s.end_date.isoformat(),
-                "description": s.description,
-                "clubs_count": len(s.clubs),
-                "created_at": s.created_at.isoformat()
-            }
-            for s in seasons
-        ]
-    }
+    body = _get_cached_response("seasons")
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    # Select just the returned columns (plus a club count subquery) so no
+    # Season or Club objects are built for a read-only listing
+    clubs_count = (
+        select(func.count(Club.id))
+        .where(Club.season_id == Season.id)
+        .correlate(Season)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            Season.id,
+            Season.year,
+            Season.name,
+            Season.is_active,
+            Season.registration_open,
+            Season.start_date,
+            Season.end_date,
+            Season.description,
+            clubs_count.label("clubs_count"),
+            Season.created_at
+        ).order_by(Season.year.desc())
+    ).mappings()
+
+    # Returned as a response directly so FastAPI skips jsonable_encoder;
+    # the encoded body is what gets cached
+    response = _json_response(_season_list_adapter, {
+        "seasons": [dict(row) for row in rows]
+    })
+    _cache_response("seasons", response.body)
+    return response
 
 @router.get("/seasons/{season_id}")
-async def get_season(
+def get_season(
     season_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """Get detailed season information (Admin only)"""
-    season = db.query(Season).filter_by(id=season_id).first()
+    # The season and its three counts come back from one statement, so the
+    # counts cost a single round trip instead of one query each
+    clubs_count = (
+        select(func.count(Club.id))
+        .where(Club.season_id == Season.id)
+        .correlate(Season)
+        .scalar_subquery()
+    )
+    players_count = (
+        select(func.count(Player.id))
+        .join(Club, Player.club_id == Club.id)
+        .where(Club.season_id == Season.id)
+        .correlate(Season)
+        .scalar_subquery()
+    )
+    leagues_count = (
+        select(func.count(League.id))
+        .where(League.season_id == Season.id)
+        .correlate(Season)
+        .scalar_subquery()
+    )
+    row = db.execute(
+        select(Season, clubs_count, players_count, leagues_count)
+        .where(Season.id == season_id)
+    ).first()
 
-    if not season:
+    if not row:
         raise HTTPException(status_code=404, detail="Season not found")
 
-    # Count players across all clubs
-    total_players = sum(len(club.players) for club in season.clubs)
+    season, clubs_count, total_players, leagues_count = row
 
     return {
         "id": season.id,
@@ -211,40 +464,42 @@ async def get_season(
         "is_active": season.is_active,
         "registration_open": season.registration_open,
         "scraping_enabled": season.scraping_enabled,
-        "start_date": season.start_date.isoformat(),
-        "end_date": season.end_date.isoformat(),
+        "start_date": season.start_date,
+        "end_date": season.end_date,
         "description": season.description,
-        "clubs_count": len(season.clubs),
+        "clubs_count": clubs_count,
         "players_count": total_players,
-        "leagues_count": len(season.leagues),
-        "created_at": season.created_at.isoformat()
+        "leagues_count": leagues_count,
+        "created_at": season.created_at
     }
 
 @router.patch("/seasons/{season_id}")
-async def update_season(
+def update_season(
     season_id: str,
     updates: SeasonUpdate,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """Update season settings (Admin only)"""
-    season = db.query(Season).filter_by(id=season_id).first()
-
-    if not season:
-        raise HTTPException(status_code=404, detail="Season not found")
-
-    # Apply updates
     update_data = updates.dict(exclude_none=True)
 
-    if "start_date" in update_data:
-        update_data["start_date"] = datetime.fromisoformat(update_data["start_date"])
-    if "end_date" in update_data:
-        update_data["end_date"] = datetime.fromisoformat(update_data["end_date"])
-
-    for key, value in update_data.items():
-        setattr(season, key, value)
+    # Apply updates with a single UPDATE ... RETURNING rather than loading
+    # the season first; an empty body just checks that it exists
+    if update_data:
+        updated_id = db.execute(
+            sql_update(Season)
+            .where(Season.id == season_id)
+            .values(**update_data)
+            .returning(Season.id)
+        ).scalar_one_or_none()
+    else:
+        updated_id = db.scalar(select(Season.id).where(Season.id == season_id))
+
+    if not updated_id:
+        raise HTTPException(status_code=404, detail="Season not found")
 
     db.commit()
+    invalidate_admin_cache()
 
     return {
         "message": "Season updated successfully",
@@ -253,7 +508,7 @@ async def update_season(
     }
 
 @router.post("/seasons/{season_id}/activate")
-async def activate_season(
+def activate_season(
     season_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -269,6 +524,7 @@ async def activate_season(
     try:
         season = service.activate_season(season_id)
         db.commit()
+        invalidate_admin_cache()
 
         return {
             "message": "Season activated successfully",
@@ -279,16 +535,13 @@ async def activate_season(
         }
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to activate season: {str(e)}")
 
 # =============================================================================
 # CLUB & TEAM MANAGEMENT ENDPOINTS
 # =============================================================================
 
 @router.post("/clubs", status_code=status.HTTP_201_CREATED)
-async def create_club(
+def create_club(
     club: ClubCreate,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -305,7 +558,7 @@ async def create_club(
 
     db.add(db_club)
     db.commit()
-    db.refresh(db_club)
+    invalidate_admin_cache()
 
     return {
         "message": "Club created successfully",
@@ -321,31 +574,50 @@ async def create_club(
     }
 
 @router.get("/clubs")
-async def list_clubs(
+def list_clubs(
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """List all clubs (Admin only)"""
-    clubs = db.query(Club).all()
+    body = _get_cached_response("clubs")
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    # Correlated COUNT subqueries keep this to one round trip without
+    # hydrating every team and player just to count them
+    teams_count = (
+        select(func.count(Team.id))
+        .where(Team.club_id == Club.id)
+        .correlate(Club)
+        .scalar_subquery()
+    )
+    players_count = (
+        select(func.count(Player.id))
+        .where(Player.club_id == Club.id)
+        .correlate(Club)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            Club.id,
+            Club.name,
+            Club.tier,
+            Club.location,
+            Club.founded_year,
+            Club.season_id,
+            teams_count.label("teams_count"),
+            players_count.label("players_count")
+        )
+    ).mappings()
 
-    return {
-        "clubs": [
-            {
-                "id": club.id,
-                "name": club.name,
-                "tier": club.tier,
-                "location": club.location,
-                "founded_year": club.founded_year,
-                "season_id": club.season_id,
-                "teams_count": len(club.teams) if club.teams else 0,
-                "players_count": len(club.players) if club.players else 0
-            }
-            for club in clubs
-        ]
-    }
+    response = _json_response(_club_list_adapter, {
+        "clubs": [dict(row) for row in rows]
+    })
+    _cache_response("clubs", response.body)
+    return response
 
 @router.post("/clubs/{club_id}/teams", status_code=status.HTTP_201_CREATED)
-async def create_team(
+def create_team(
     club_id: str,
     team: TeamCreate,
     admin: dict = Depends(verify_admin),
@@ -353,7 +625,7 @@ async def create_team(
 ):
     """Create a team within a club (Admin only)"""
     # Verify club exists
-    club = db.query(Club).filter_by(id=club_id).first()
+    club = db.get(Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail=f"Club not found: {club_id}")
 
@@ -369,7 +641,7 @@ async def create_team(
 
     db.add(db_team)
     db.commit()
-    db.refresh(db_team)
+    invalidate_admin_cache()
 
     return {
         "message": "Team created successfully",
@@ -416,7 +688,7 @@ async def update_team_multiplier(
 # =============================================================================
 
 @router.get("/clubs/{club_id}/players")
-async def get_club_players(
+def get_club_players(
     club_id: str,
     role: Optional[str] = None,
     min_multiplier: Optional[float] = None,
@@ -429,41 +701,52 @@ async def get_club_players(
 
     Supports filtering by role and multiplier range.
     """
-    query = db.query(Player).filter_by(club_id=club_id)
+    cache_key = (_players_version, club_id, role, min_multiplier, max_multiplier)
+    body = _get_cached_player_list(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    conditions = [Player.club_id == club_id]
 
     # Apply filters
     if role:
-        query = query.filter(Player.role == role)
+        conditions.append(Player.role == role)
     if min_multiplier:
-        query = query.filter(Player.multiplier >= min_multiplier)
+        conditions.append(Player.multiplier >= min_multiplier)
     if max_multiplier:
-        query = query.filter(Player.multiplier <= max_multiplier)
-
-    players = query.all()
-
-    return {
-        "club_id": club_id,
-        "total_players": len(players),
-        "players": [
-            {
-                "id": p.id,
-                "name": p.name,
-                "rl_team": p.rl_team,
-                "team_name": p.rl_team,  # Frontend expects team_name
-                "role": p.role,
-                "tier": p.tier,
-                "base_price": p.base_price,
-                "current_price": p.current_price,
-                "multiplier": p.multiplier,
-                "multiplier_updated_at": p.multiplier_updated_at.isoformat() if p.multiplier_updated_at else None,
-                "is_active": p.is_active,
-                "created_at": p.created_at.isoformat()
-            }
-            for p in players
-        ]
-    }
+        conditions.append(Player.multiplier <= max_multiplier)
+
+    total_players = db.scalar(select(func.count(Player.id)).where(*conditions))
+
+    # Only the returned columns are selected; rows come back as plain
+    # mappings rather than Player objects
+    players = select(
+        Player.id,
+        Player.name,
+        Player.rl_team,
+        Player.rl_team.label("team_name"),  # Frontend expects team_name
+        Player.role,
+        Player.tier,
+        Player.base_price,
+        Player.current_price,
+        Player.multiplier,
+        Player.multiplier_updated_at,
+        Player.is_active,
+        Player.created_at
+    ).where(*conditions)
+
+    rows = db.execute(
+        players.execution_options(yield_per=STREAM_BATCH_SIZE)
+    ).mappings()
+
+    return _stream_json(
+        {"club_id": club_id, "total_players": total_players},
+        "players",
+        rows,
+        on_complete=lambda body: _cache_player_list(cache_key, body)
+    )
 
-class PlayerManualAdd(BaseModel):
+class PlayerManualAdd(AdminRequest):
     """Add a player manually"""
     name: str
     rl_team: str = Field(..., description="Real-life team: ACC 1-6, ZAMI 1, U13, U15, U17")
@@ -474,7 +757,7 @@ class PlayerManualAdd(BaseModel):
     multiplier: float = Field(default=1.0, ge=0.5, le=5.0, description="Performance multiplier (0.5-5.0)")
 
 @router.post("/clubs/{club_id}/players", status_code=status.HTTP_201_CREATED)
-async def add_player_manually(
+def add_player_manually(
     club_id: str,
     player: PlayerManualAdd,
     admin: dict = Depends(verify_admin),
@@ -486,52 +769,45 @@ async def add_player_manually(
     Use this to add players who weren't in the legacy roster
     or to add new players during the season.
     """
-    try:
-        # Verify club exists
-        club = db.query(Club).filter_by(id=club_id).first()
-        if not club:
-            raise HTTPException(status_code=404, detail=f"Club not found: {club_id}")
+    # Verify club exists
+    club = db.get(Club, club_id)
+    if not club:
+        raise HTTPException(status_code=404, detail=f"Club not found: {club_id}")
 
-        # Create player
-        new_player = Player(
-            club_id=club_id,
-            name=player.name,
-            rl_team=player.rl_team,
-            role=player.role,
-            tier=player.tier,
-            base_price=player.base_price,
-            current_price=player.current_price or player.base_price,
-            multiplier=player.multiplier,
-            multiplier_updated_at=datetime.utcnow(),
-            is_active=True
-        )
+    # Create player
+    new_player = Player(
+        club_id=club_id,
+        name=player.name,
+        rl_team=player.rl_team,
+        role=player.role,
+        tier=player.tier,
+        base_price=player.base_price,
+        current_price=player.current_price or player.base_price,
+        multiplier=player.multiplier,
+        multiplier_updated_at=datetime.utcnow(),
+        is_active=True
+    )
 
-        db.add(new_player)
-        db.commit()
-        db.refresh(new_player)
+    db.add(new_player)
+    db.commit()
+    invalidate_player_cache()
 
-        return {
-            "message": "Player added successfully",
-            "player": {
-                "id": new_player.id,
-                "name": new_player.name,
-                "rl_team": new_player.rl_team,
-                "role": new_player.role,
-                "tier": new_player.tier,
-                "base_price": new_player.base_price,
-                "current_price": new_player.current_price,
-                "multiplier": new_player.multiplier
-            }
+    return {
+        "message": "Player added successfully",
+        "player": {
+            "id": new_player.id,
+            "name": new_player.name,
+            "rl_team": new_player.rl_team,
+            "role": new_player.role,
+            "tier": new_player.tier,
+            "base_price": new_player.base_price,
+            "current_price": new_player.current_price,
+            "multiplier": new_player.multiplier
         }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to add player: {str(e)}")
+    }
 
 @router.patch("/players/{player_id}/value")
-async def update_player_value(
+def update_player_value(
     player_id: str,
     update: PlayerValueUpdate,
     admin: dict = Depends(verify_admin),
@@ -554,6 +830,7 @@ async def update_player_value(
         )
 
         db.commit()
+        invalidate_player_cache()
 
         return {
             "message": "Player value updated",
@@ -567,11 +844,8 @@ async def update_player_value(
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to update value: {str(e)}")
 
-class PlayerUpdate(BaseModel):
+class PlayerUpdate(AdminRequest):
     """Update player details"""
     name: Optional[str] = None
     rl_team: Optional[str] = Field(None, description="Real-life team: ACC 1-6, ZAMI 1, U13, U15, U17")
@@ -583,7 +857,7 @@ class PlayerUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 @router.put("/players/{player_id}")
-async def update_player(
+def update_player(
     player_id: str,
     update: PlayerUpdate,
     admin: dict = Depends(verify_admin),
@@ -594,65 +868,45 @@ async def update_player(
 
     Allows editing player name, role, tier, pricing, multiplier, and active status.
     """
-    try:
-        # Get player
-        player = db.query(Player).filter_by(id=player_id).first()
-        if not player:
-            raise HTTPException(status_code=404, detail=f"Player not found: {player_id}")
-
-        # Update fields
-        if update.name is not None:
-            player.name = update.name
-
-        if update.rl_team is not None:
-            player.rl_team = update.rl_team
-
-        if update.role is not None:
-            player.role = update.role
-
-        if update.tier is not None:
-            player.tier = update.tier
-
-        if update.base_price is not None:
-            player.base_price = update.base_price
-
-        if update.current_price is not None:
-            player.current_price = update.current_price
-
-        if update.multiplier is not None:
-            player.multiplier = update.multiplier
-            player.multiplier_updated_at = datetime.utcnow()
+    update_data = update.dict(exclude_none=True)
+    if "multiplier" in update_data:
+        update_data["multiplier_updated_at"] = datetime.utcnow()
+
+    # One UPDATE ... RETURNING both applies the changes and loads the row
+    if update_data:
+        player = db.execute(
+            sql_update(Player)
+            .where(Player.id == player_id)
+            .values(**update_data)
+            .returning(Player)
+        ).scalar_one_or_none()
+    else:
+        player = db.get(Player, player_id)
+
+    if not player:
+        raise HTTPException(status_code=404, detail=f"Player not found: {player_id}")
 
-        if update.is_active is not None:
-            player.is_active = update.is_active
-
-        db.commit()
-        db.refresh(player)
+    db.commit()
+    invalidate_player_cache()
 
-        return {
-            "message": "Player updated successfully",
-            "player": {
-                "id": player.id,
-                "name": player.name,
-                "rl_team": player.rl_team,
-                "role": player.role,
-                "tier": player.tier,
-                "base_price": player.base_price,
-                "current_price": player.current_price,
-                "multiplier": player.multiplier,
-                "multiplier_updated_at": player.multiplier_updated_at.isoformat() if player.multiplier_updated_at else None,
-                "is_active": player.is_active
-            }
+    return {
+        "message": "Player updated successfully",
+        "player": {
+            "id": player.id,
+            "name": player.name,
+            "rl_team": player.rl_team,
+            "role": player.role,
+            "tier": player.tier,
+            "base_price": player.base_price,
+            "current_price": player.current_price,
+            "multiplier": player.multiplier,
+            "multiplier_updated_at": player.multiplier_updated_at,
+            "is_active": player.is_active
         }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to update player: {str(e)}")
+    }
 
 @router.delete("/players/{player_id}")
-async def delete_player(
+def delete_player(
     player_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -662,38 +916,50 @@ async def delete_player(
 
     This will also remove the player from any fantasy teams.
     """
-    try:
-        # Get player
-        player = db.query(Player).filter_by(id=player_id).first()
-        if not player:
-            raise HTTPException(status_code=404, detail=f"Player not found: {player_id}")
+    # Get player
+    player = db.get(Player, player_id)
+    if not player:
+        raise HTTPException(status_code=404, detail=f"Player not found: {player_id}")
 
-        player_name = player.name
+    player_name = player.name
 
-        # Delete player (cascade will handle fantasy_team_players and price_history)
-        db.delete(player)
-        db.commit()
-
-        return {
-            "message": "Player deleted successfully",
-            "player_id": player_id,
-            "player_name": player_name
-        }
+    # Delete player (cascade will handle fantasy_team_players and price_history)
+    db.delete(player)
+    db.commit()
+    invalidate_player_cache()
 
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to delete player: {str(e)}")
+    return {
+        "message": "Player deleted successfully",
+        "player_id": player_id,
+        "player_name": player_name
+    }
 
 @router.post("/players/bulk-value-update")
-async def bulk_update_player_values(
+def bulk_update_player_values(
     updates: List[PlayerValueUpdate],
-    admin: dict = Depends(verify_admin)
+    admin: dict = Depends(verify_admin),
+    db: Session = Depends(get_db)
 ):
-    """Bulk update player values (Admin only)"""
-    # TODO: Batch update in database
+    """
+    Bulk update player values (Admin only)
+
+    All prices are written in one UPDATE and all price history rows in
+    one INSERT, regardless of how many players are in the batch.
+    """
+    service = SeasonSetupService(db)
+
+    result = service.bulk_update_player_values(
+        updates=[u.dict() for u in updates],
+        changed_by=admin["user_id"]
+    )
+
+    db.commit()
+    invalidate_player_cache()
+
     return {
-        "message": f"Updated {len(updates)} player values",
-        "updated_count": len(updates)
+        "message": f"Updated {len(result['updated'])} player values",
+        "updated_count": len(result["updated"]),
+        "missing_player_ids": result["missing"]
     }
 
 @router.get("/players/unassigned")
@@ -719,6 +985,7 @@ async def create_league_template(
     Users can select from these templates when creating leagues.
     """
     # TODO: Save to database
+    invalidate_admin_cache()
     return {
         "message": "League template created",
         "template_id": "temp_template_id",
@@ -728,8 +995,12 @@ async def create_league_template(
 @router.get("/league-templates")
 async def list_league_templates(admin: dict = Depends(verify_admin)):
     """List all league templates (Admin only)"""
+    payload = _get_cached_response("league_templates")
+    if payload is not None:
+        return payload
+
     # TODO: Fetch from database
-    return {
+    return _cache_response("league_templates", {
         "templates": [
             {
                 "id": "standard",
@@ -738,31 +1009,31 @@ async def list_league_templates(admin: dict = Depends(verify_admin)):
                 "budget": 500.0
             }
         ]
-    }
+    })
 
 # =============================================================================
 # DATA IMPORT ENDPOINTS
 # =============================================================================
 
-class SeasonSetupRequest(BaseModel):
+class SeasonSetupRequest(AdminRequest):
     """Complete season setup with club and roster"""
     year: str = Field(..., example="2026")
     season_name: str = Field(..., example="Topklasse 2026")
-    start_date: str = Field(..., example="2026-04-01")
-    end_date: str = Field(..., example="2026-09-30")
+    start_date: datetime = Field(..., example="2026-04-01")
+    end_date: datetime = Field(..., example="2026-09-30")
     club_name: str = Field(..., example="ACC")
     club_full_name: str = Field(..., example="Amsterdamsche Cricket Club")
     roster_file: str = Field(default="rosters/acc_2025_complete.json")
     activate: bool = Field(default=True)
 
 
-class PasswordResetRequest(BaseModel):
+class PasswordResetRequest(AdminRequest):
     """Request body for password reset"""
     new_password: str = Field(..., min_length=6)
 
 
 @router.post("/setup-season", status_code=status.HTTP_201_CREATED)
-async def setup_complete_season(
+def setup_complete_season(
     request: SeasonSetupRequest,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -792,16 +1063,12 @@ async def setup_complete_season(
     try:
         service = SeasonSetupService(db)
 
-        # Parse dates
-        start_date = datetime.fromisoformat(request.start_date)
-        end_date = datetime.fromisoformat(request.end_date)
-
         # Run complete setup workflow
         result = service.setup_season_with_club(
             year=request.year,
             season_name=request.season_name,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=request.start_date,
+            end_date=request.end_date,
             club_name=request.club_name,
             club_full_name=request.club_full_name,
             roster_file_path=request.roster_file,
@@ -810,6 +1077,8 @@ async def setup_complete_season(
         )
 
         db.commit()
+        invalidate_player_cache()
+        invalidate_admin_cache()
 
         return {
             "message": f"Season {request.year} setup complete!",
@@ -818,14 +1087,9 @@ async def setup_complete_season(
 
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"Roster file not found: {str(e)}")
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to setup season: {str(e)}")
 
 @router.post("/clubs/{club_id}/load-roster")
-async def load_roster_for_club(
+def load_roster_for_club(
     club_id: str,
     roster_file: str,
     admin: dict = Depends(verify_admin),
@@ -846,6 +1110,7 @@ async def load_roster_for_club(
         )
 
         db.commit()
+        invalidate_player_cache()
 
         return {
             "message": "Roster loaded successfully",
@@ -854,14 +1119,9 @@ async def load_roster_for_club(
 
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"Roster file not found: {str(e)}")
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to load roster: {str(e)}")
 
 @router.post("/roster/confirm")
-async def confirm_roster(
+def confirm_roster(
     request: dict,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -919,6 +1179,7 @@ async def confirm_roster(
         )
 
         db.commit()
+        invalidate_player_cache()
 
         # Get active player counts
         active_count = db.query(Player).filter(Player.is_active == True).count()
@@ -957,6 +1218,7 @@ async def confirm_roster(
                         })
 
                     db.commit()
+                    invalidate_player_cache()
 
                     # Add multiplier info to result
                     result["multipliers_calculated"] = True
@@ -986,7 +1248,11 @@ async def confirm_roster(
 @router.get("/system/status")
 async def get_system_status(admin: dict = Depends(verify_admin)):
     """Get system status and configuration (Admin only)"""
-    return {
+    payload = _get_cached_response("system_status")
+    if payload is not None:
+        return payload
+
+    return _cache_response("system_status", {
         "scraping_enabled": True,
         "active_season": "2026",
         "total_clubs": 1,
@@ -994,7 +1260,7 @@ async def get_system_status(admin: dict = Depends(verify_admin)):
         "total_leagues": 0,
         "last_scrape": None,
         "next_scrape": "Monday 01:00 AM"
-    }
+    })
 
 @router.post("/scrape/trigger")
 async def trigger_manual_scrape(
@@ -1094,38 +1360,37 @@ async def get_player_value_breakdown(
 # =============================================================================
 
 @router.get("/users")
-async def list_users(
+def list_users(
     admin_data: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """List all users in the system"""
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    
-    return {
-        "users": [
-            {
-                "id": user.id,
-                "email": user.email,
-                "full_name": user.full_name,
-                "is_admin": user.is_admin,
-                "is_active": user.is_active,
-                "is_verified": user.is_verified,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-                "last_login": user.last_login.isoformat() if user.last_login else None
-            }
-            for user in users
-        ]
-    }
+    rows = db.execute(
+        select(
+            User.id,
+            User.email,
+            User.full_name,
+            User.is_admin,
+            User.is_active,
+            User.is_verified,
+            User.created_at,
+            User.last_login
+        )
+        .order_by(User.created_at.desc())
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    ).mappings()
+
+    return _stream_json({}, "users", rows)
 
 
 @router.post("/users/{user_id}/promote")
-async def promote_user_to_admin(
+def promote_user_to_admin(
     user_id: str,
     admin_data: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """Promote a user to admin status"""
-    user = db.query(User).filter_by(id=user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -1154,13 +1419,13 @@ async def promote_user_to_admin(
 
 
 @router.post("/users/{user_id}/demote")
-async def demote_admin_user(
+def demote_admin_user(
     user_id: str,
     admin_data: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """Demote an admin user to regular user"""
-    user = db.query(User).filter_by(id=user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -1197,7 +1462,7 @@ async def demote_admin_user(
 
 
 @router.post("/users/{user_id}/reset-password")
-async def admin_reset_user_password(
+def admin_reset_user_password(
     user_id: str,
     request: PasswordResetRequest,
     admin_data: dict = Depends(verify_admin),
@@ -1206,7 +1471,7 @@ async def admin_reset_user_password(
     """Admin endpoint to reset a user's password"""
     from user_auth_endpoints import hash_password
 
-    user = db.query(User).filter_by(id=user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -1229,7 +1494,7 @@ async def admin_reset_user_password(
 
 
 @router.delete("/users/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: str,
     admin_data: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -1244,7 +1509,7 @@ async def delete_user(
             detail="Cannot delete your own account"
         )
 
-    user = db.query(User).filter_by(id=user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -1263,44 +1528,64 @@ async def delete_user(
 
 
 @router.delete("/leagues/{league_id}")
-async def delete_league(
+def delete_league(
     league_id: str,
     admin_data: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """Admin endpoint to delete a league and all associated fantasy teams"""
 
-    league = db.query(League).filter(League.id == league_id).first()
+    # Set-based deletes, children first, instead of letting the ORM cascade
+    # load and delete every fantasy team, team player and transfer row by row
+    bulk = {"synchronize_session": False}
+    league_team_ids = select(FantasyTeam.id).where(FantasyTeam.league_id == league_id)
+
+    db.execute(
+        delete(FantasyTeamPlayer).where(FantasyTeamPlayer.fantasy_team_id.in_(league_team_ids)),
+        execution_options=bulk
+    )
+    db.execute(
+        delete(Transfer).where(Transfer.fantasy_team_id.in_(league_team_ids)),
+        execution_options=bulk
+    )
+    team_count = db.execute(
+        delete(FantasyTeam).where(FantasyTeam.league_id == league_id),
+        execution_options=bulk
+    ).rowcount
+    db.execute(
+        delete(LeagueRoster).where(LeagueRoster.league_id == league_id),
+        execution_options=bulk
+    )
+    league_name = db.execute(
+        delete(League).where(League.id == league_id).returning(League.name),
+        execution_options=bulk
+    ).scalar_one_or_none()
 
-    if not league:
+    if league_name is None:
+        # Nothing was deleted above; get_db rolls back on the way out
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="League not found"
         )
 
-    # Count fantasy teams that will be deleted
-    team_count = db.query(FantasyTeam).filter(FantasyTeam.league_id == league_id).count()
-
-    # Delete the league (cascade will delete fantasy teams)
-    db.delete(league)
     db.commit()
 
     return {
-        "message": f"League '{league.name}' deleted successfully",
+        "message": f"League '{league_name}' deleted successfully",
         "league_id": league_id,
         "fantasy_teams_deleted": team_count
     }
 
 
 @router.delete("/teams/{team_id}")
-async def delete_team(
+def delete_team(
     team_id: str,
     admin_data: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """Admin endpoint to delete a fantasy team"""
 
-    team = db.query(FantasyTeam).filter(FantasyTeam.id == team_id).first()
+    team = db.get(FantasyTeam, team_id)
 
     if not team:
         raise HTTPException(
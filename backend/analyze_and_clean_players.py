@@ -2,16 +2,25 @@
 """
 Analyze and clean up player data
 """
+import csv
 import os
 import re
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, select
 from sqlalchemy.orm import sessionmaker
-from database_models import Base, Player, Team, Club
-from collections import defaultdict
+from database_models import Base, Player, Club, FantasyTeam, FantasyTeamPlayer
+from collections import Counter, defaultdict
 
 # Database connection
 DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://cricket_admin:your_secure_password_here@db:5432/fantasy_cricket')
-engine = create_engine(DATABASE_URL)
+# The script can sit idle at the cleanup prompt for a long time, so check
+# connections before use and recycle them rather than hitting a dead one
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800
+)
 Session = sessionmaker(bind=engine)
 db = Session()
 
@@ -28,6 +37,12 @@ INVALID_PATTERNS = [
     r'^\(\)',  # Empty parentheses
 ]
 
+# Ids per DELETE statement when cleaning up
+DELETE_BATCH_SIZE = 1000
+
+# Rows fetched per round trip while scanning the club's players
+SCAN_BATCH_SIZE = 1000
+
 # Known opposition team names (not ACC teams)
 OPPOSITION_TEAMS = [
     'Rood en Wit', 'Salland', 'Ajax', 'Quick', 'VRA', 'VOC', 'Kampong',
@@ -35,18 +50,38 @@ OPPOSITION_TEAMS = [
     'Dosti', 'SV Kampong'
 ]
 
-def is_invalid_player(name):
-    """Check if a player name matches invalid patterns"""
-    for pattern in INVALID_PATTERNS:
-        if re.search(pattern, name, re.IGNORECASE):
-            return True
-
-    # Check if it's an opposition team name
-    for team_name in OPPOSITION_TEAMS:
-        if team_name.lower() in name.lower():
-            return True
+# Each list compiled into a single alternation, so a name is checked with
+# one regex scan per list rather than one search per pattern
+INVALID_RE = re.compile("|".join(f"(?:{p})" for p in INVALID_PATTERNS), re.IGNORECASE)
+OPPOSITION_RE = re.compile("|".join(re.escape(t) for t in OPPOSITION_TEAMS), re.IGNORECASE)
 
-    return False
+def is_invalid_player(name):
+    """Check if a player name matches invalid patterns or an opposition team name"""
+    return bool(INVALID_RE.search(name) or OPPOSITION_RE.search(name))
+
+def delete_players(player_ids, batch_size=DELETE_BATCH_SIZE):
+    """
+    Delete players by id with bulk DELETE ... WHERE id IN (...) statements.
+
+    Ids are sent in batches to stay well under driver parameter limits;
+    the caller wraps them in one transaction. The bulk DELETE skips the ORM
+    cascade on Player.fantasy_team_players, so each batch first removes the
+    players' fantasy squad entries and clears captaincies pointing at them.
+    """
+    deleted = 0
+    for start in range(0, len(player_ids), batch_size):
+        batch = player_ids[start:start + batch_size]
+        db.query(FantasyTeamPlayer).filter(
+            FantasyTeamPlayer.player_id.in_(batch)
+        ).delete(synchronize_session=False)
+        db.query(FantasyTeam).filter(
+            FantasyTeam.captain_id.in_(batch)
+        ).update({FantasyTeam.captain_id: None}, synchronize_session=False)
+        db.query(FantasyTeam).filter(
+            FantasyTeam.vice_captain_id.in_(batch)
+        ).update({FantasyTeam.vice_captain_id: None}, synchronize_session=False)
+        deleted += db.query(Player).filter(Player.id.in_(batch)).delete(synchronize_session=False)
+    return deleted
 
 def main():
     print("=" * 80)
@@ -58,27 +93,36 @@ def main():
     if not acc_club:
         print("ERROR: ACC club not found!")
         return
-
-    # Get all players
-    all_players = db.query(Player).filter_by(club_id=acc_club.id).all()
-    print(f"\nTotal players: {len(all_players)}")
-
-    # Analyze invalid entries
+    acc_club_id = acc_club.id
+
+    # Get all players - only the columns the report needs, as plain rows,
+    # with the team name resolved in the same query. Players carry their team
+    # in rl_team (team_id/player_type were migrated to rl_team/role), so no
+    # join or per-player Team lookup is needed.
+    players_query = select(
+        Player.id, Player.name, Player.multiplier, Player.role,
+        func.coalesce(Player.rl_team, 'Unknown').label('team_name')
+    ).where(Player.club_id == acc_club_id).execution_options(yield_per=SCAN_BATCH_SIZE)
+
+    # Analyze invalid entries. The scan is read-only, so stream it in batches
+    # through a server-side cursor without flushing the session.
     invalid_players = []
     valid_players = []
 
-    for player in all_players:
-        if is_invalid_player(player.name):
-            invalid_players.append(player)
-        else:
-            valid_players.append(player)
+    with db.no_autoflush:
+        for batch in db.execute(players_query).partitions():
+            for player in batch:
+                if is_invalid_player(player.name):
+                    invalid_players.append(player)
+                else:
+                    valid_players.append(player)
+
+    print(f"\nTotal players: {len(invalid_players) + len(valid_players)}")
 
     print(f"\n{len(invalid_players)} invalid entries found:")
     print("\nSample of invalid entries:")
     for player in invalid_players[:30]:
-        team = db.query(Team).filter_by(id=player.team_id).first()
-        team_name = team.name if team else "Unknown"
-        print(f"  [{team_name}] {player.name}")
+        print(f"  [{player.team_name}] {player.name}")
 
     if len(invalid_players) > 30:
         print(f"  ... and {len(invalid_players) - 30} more")
@@ -86,36 +130,44 @@ def main():
     # Check for duplicates among valid players
     print(f"\n{len(valid_players)} potentially valid players")
 
-    name_counts = defaultdict(list)
+    # Group on the generated normalized_name column (lowercase, no spaces) in
+    # Postgres so only names shared by several players come back; groups are
+    # then narrowed to valid players, as invalid ones are reported above
+    name_groups = db.query(
+        Player.normalized_name, func.array_agg(Player.id)
+    ).filter(
+        Player.club_id == acc_club_id
+    ).group_by(
+        Player.normalized_name
+    ).having(
+        func.count() > 1
+    ).all()
+
+    # Only the rows in duplicate groups are indexed and collected, so memory
+    # beyond the scan itself is proportional to the duplicates, not the club
+    norm_name_by_id = {pid: norm_name for norm_name, ids in name_groups for pid in ids}
+    duplicates = defaultdict(list)
     for player in valid_players:
-        # Normalize name for comparison (lowercase, remove spaces)
-        norm_name = player.name.lower().replace(' ', '')
-        name_counts[norm_name].append(player)
-
-    duplicates = {name: players for name, players in name_counts.items() if len(players) > 1}
+        norm_name = norm_name_by_id.get(player.id)
+        if norm_name is not None:
+            duplicates[norm_name].append(player)
+    duplicates = {name: players for name, players in duplicates.items() if len(players) > 1}
 
     if duplicates:
         print(f"\n{len(duplicates)} duplicate player names found:")
         for norm_name, players in list(duplicates.items())[:20]:
             print(f"\n  {players[0].name} ({len(players)} occurrences):")
             for p in players:
-                team = db.query(Team).filter_by(id=p.team_id).first()
-                team_name = team.name if team else "Unknown"
-                print(f"    - [{team_name}] multiplier={p.multiplier}, type={p.player_type}")
+                print(f"    - [{p.team_name}] multiplier={p.multiplier}, type={p.role}")
 
     # Count by team after cleanup
     print("\n" + "=" * 80)
     print("DISTRIBUTION OF VALID PLAYERS BY TEAM:")
     print("=" * 80)
 
-    valid_by_team = defaultdict(list)
-    for player in valid_players:
-        team = db.query(Team).filter_by(id=player.team_id).first()
-        team_name = team.name if team else "Unknown"
-        valid_by_team[team_name].append(player)
-
-    for team_name, players in sorted(valid_by_team.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"  {team_name}: {len(players)} players")
+    team_counts = Counter(player.team_name for player in valid_players)
+    for team_name, count in team_counts.most_common():
+        print(f"  {team_name}: {count} players")
 
     total_after_cleanup = len(valid_players) - len([p for players in duplicates.values() for p in players[1:]])
     print(f"\nTotal valid unique players: ~{total_after_cleanup}")
@@ -129,39 +181,41 @@ def main():
     print("3. Export valid player list for manual review")
     print("4. Cancel")
 
+    # Don't hold the read transaction open while waiting for input; each
+    # cleanup option below runs in its own single transaction
+    db.rollback()
+
     choice = input("\nEnter your choice (1-4): ")
 
     if choice == '1':
         print(f"\nDeleting {len(invalid_players)} invalid entries...")
-        for player in invalid_players:
-            db.delete(player)
-        db.commit()
+        with db.begin():
+            delete_players([player.id for player in invalid_players])
         print("✓ Invalid entries deleted")
 
-        remaining = db.query(Player).filter_by(club_id=acc_club.id).count()
+        remaining = db.query(Player).filter_by(club_id=acc_club_id).count()
         print(f"Remaining players: {remaining}")
 
     elif choice == '2':
         print("\nDeleting duplicate players (keeping first occurrence)...")
-        deleted_count = 0
-        for players in duplicates.values():
-            # Keep first, delete rest
-            for player in players[1:]:
-                db.delete(player)
-                deleted_count += 1
-        db.commit()
+        # Keep first, delete rest
+        duplicate_ids = [p.id for players in duplicates.values() for p in players[1:]]
+        with db.begin():
+            deleted_count = delete_players(duplicate_ids)
         print(f"✓ Deleted {deleted_count} duplicate entries")
 
-        remaining = db.query(Player).filter_by(club_id=acc_club.id).count()
+        remaining = db.query(Player).filter_by(club_id=acc_club_id).count()
         print(f"Remaining players: {remaining}")
 
     elif choice == '3':
         print("\nExporting valid players to 'acc_valid_players.csv'...")
-        with open('acc_valid_players.csv', 'w') as f:
-            f.write("team,player_name,player_type,multiplier,player_id\n")
-            for team_name, players in sorted(valid_by_team.items()):
-                for player in sorted(players, key=lambda p: p.name):
-                    f.write(f'{team_name},"{player.name}",{player.player_type},{player.multiplier},{player.id}\n')
+        with open('acc_valid_players.csv', 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(["team", "player_name", "player_type", "multiplier", "player_id"])
+            writer.writerows(
+                (player.team_name, player.name, player.role, player.multiplier, player.id)
+                for player in sorted(valid_players, key=lambda p: (p.team_name, p.name))
+            )
         print("✓ Exported to acc_valid_players.csv")
 
     else:
@@ -7,10 +7,18 @@ FastAPI endpoints to access aggregated player data.
 Add these to your main.py to expose player stats via API.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+from typing import Callable, List, Optional
 from pydantic import BaseModel
+import hashlib
+import orjson
+import redis
 from celery_tasks import (
+    LAST_SCRAPE_KEY,
+    LEADERBOARD_CACHE_PREFIX,
+    LEADERBOARD_CACHE_TTL,
+    leaderboard_cache,
     get_player_stats,
     get_club_roster,
     get_top_fantasy_scorers,
@@ -40,6 +48,61 @@ class SeasonSummary(BaseModel):
     top_scorers: list
 
 
+# Stats only change when a scrape completes, so clients may reuse a response
+# briefly and revalidate it with If-None-Match afterwards
+STATS_CACHE_CONTROL = "public, max-age=30"
+
+
+def _scrape_etag(key: str, last_scrape_ts: Optional[bytes]) -> Optional[str]:
+    """
+    Strong ETag for an endpoint key as of the last completed scrape, or None
+    when no scrape time is recorded (the data may still change, e.g. after a
+    restart loads newer aggregates, so there's nothing stable to tag)
+    """
+    if not last_scrape_ts:
+        return None
+    digest = hashlib.blake2b(key.encode() + b":" + last_scrape_ts, digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers etag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(","))
+
+
+def _cached_json(request: Request, key: str, build: Callable[[], object]) -> Response:
+    """
+    Serve a JSON payload from the Redis leaderboard cache, building and
+    storing it on a miss, with an ETag tied to the last scrape so repeat
+    clients get a bodiless 304. Redis being unavailable only costs the
+    cache and the ETag.
+    """
+    cache_key = LEADERBOARD_CACHE_PREFIX + key
+    try:
+        last_scrape_ts, cached = (
+            leaderboard_cache.pipeline().get(LAST_SCRAPE_KEY).get(cache_key).execute()
+        )
+        etag = _scrape_etag(key, last_scrape_ts)
+        headers = {"ETag": etag, "Cache-Control": STATS_CACHE_CONTROL} if etag else {}
+    except redis.RedisError:
+        cached, headers = None, {}
+
+    if headers and _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers=headers)
+
+    body = orjson.dumps(build())
+    try:
+        leaderboard_cache.setex(cache_key, LEADERBOARD_CACHE_TTL, body)
+    except redis.RedisError:
+        pass
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # =============================================================================
 # PLAYER ENDPOINTS
 # =============================================================================
@@ -83,27 +146,28 @@ async def search_players(
         List of players matching criteria
     """
     if club:
-        players = get_club_roster(club)
+        players = get_club_roster(club, limit=limit)
     else:
         # Get top players by fantasy points
         players = get_top_fantasy_scorers(limit)
 
-    # Serialize for JSON
-    serialized = []
-    for player in players:
-        player_copy = player.copy()
-        player_copy['processed_matches'] = list(player.get('processed_matches', set()))
-        serialized.append(player_copy)
-
-    return serialized[:limit]
+    # Serialize for JSON (processed_matches is a set); only the players
+    # being returned are copied
+    return [
+        {**player, 'processed_matches': list(player.get('processed_matches', set()))}
+        for player in players
+    ]
 
 
 # =============================================================================
 # LEADERBOARDS
 # =============================================================================
+# Handlers that talk to Redis are plain `def` so FastAPI runs them in its
+# threadpool instead of blocking the event loop on a slow Redis.
 
 @router.get("/leaderboards/fantasy-points", response_model=List[dict])
-async def fantasy_points_leaderboard(
+def fantasy_points_leaderboard(
+    request: Request,
     limit: int = Query(10, le=50, description="Number of players to return")
 ):
     """
@@ -112,20 +176,19 @@ async def fantasy_points_leaderboard(
     Returns:
         List of top players sorted by fantasy points
     """
-    players = get_top_fantasy_scorers(limit)
-
-    return [{
+    return _cached_json(request, f"fantasy-points:{limit}", lambda: [{
         'player_id': p['player_id'],
         'player_name': p['player_name'],
         'club': p['club'],
         'fantasy_points': p['season_totals']['fantasy_points'],
         'matches_played': p['matches_played'],
         'avg_per_match': p['averages']['fantasy_points_per_match']
-    } for p in players]
+    } for p in get_top_fantasy_scorers(limit)])
 
 
 @router.get("/leaderboards/runs", response_model=List[dict])
-async def runs_leaderboard(
+def runs_leaderboard(
+    request: Request,
     limit: int = Query(10, le=50, description="Number of players to return")
 ):
     """
@@ -134,9 +197,7 @@ async def runs_leaderboard(
     Returns:
         List of top batters sorted by runs scored
     """
-    players = get_top_run_scorers(limit)
-
-    return [{
+    return _cached_json(request, f"runs:{limit}", lambda: [{
         'player_id': p['player_id'],
         'player_name': p['player_name'],
         'club': p['club'],
@@ -145,11 +206,12 @@ async def runs_leaderboard(
         'strike_rate': p['averages']['strike_rate'],
         'fifties': p['season_totals']['batting']['fifties'],
         'centuries': p['season_totals']['batting']['centuries']
-    } for p in players]
+    } for p in get_top_run_scorers(limit)])
 
 
 @router.get("/leaderboards/wickets", response_model=List[dict])
-async def wickets_leaderboard(
+def wickets_leaderboard(
+    request: Request,
     limit: int = Query(10, le=50, description="Number of players to return")
 ):
     """
@@ -158,9 +220,7 @@ async def wickets_leaderboard(
     Returns:
         List of top bowlers sorted by wickets taken
     """
-    players = get_top_wicket_takers(limit)
-
-    return [{
+    return _cached_json(request, f"wickets:{limit}", lambda: [{
         'player_id': p['player_id'],
         'player_name': p['player_name'],
         'club': p['club'],
@@ -168,7 +228,7 @@ async def wickets_leaderboard(
         'average': p['averages']['bowling_average'],
         'economy': p['averages']['economy_rate'],
         'five_wicket_hauls': p['season_totals']['bowling']['five_wicket_hauls']
-    } for p in players]
+    } for p in get_top_wicket_takers(limit)])
 
 
 # =============================================================================
@@ -176,7 +236,7 @@ async def wickets_leaderboard(
 # =============================================================================
 
 @router.get("/clubs/{club_name}/roster", response_model=List[dict])
-async def get_club_players(club_name: str):
+def get_club_players(club_name: str, request: Request, response: Response):
     """
     Get all players for a specific club
 
@@ -186,6 +246,16 @@ async def get_club_players(club_name: str):
     Returns:
         List of all discovered players for this club
     """
+    try:
+        etag = _scrape_etag(f"roster:{club_name}", leaderboard_cache.get(LAST_SCRAPE_KEY))
+    except redis.RedisError:
+        etag = None
+    if etag:
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": STATS_CACHE_CONTROL})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = STATS_CACHE_CONTROL
+
     players = get_club_roster(club_name)
 
     if not players:
@@ -209,14 +279,14 @@ async def get_club_players(club_name: str):
 # =============================================================================
 
 @router.get("/season/summary", response_model=dict)
-async def season_summary():
+def season_summary(request: Request):
     """
     Get overall season summary
 
     Returns:
         Summary of entire season including player counts and top performers
     """
-    return get_season_summary()
+    return _cached_json(request, "season-summary", get_season_summary)
 
 
 # =============================================================================
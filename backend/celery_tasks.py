@@ -6,11 +6,19 @@ Autonomous scheduled tasks for scraping and updating player data.
 Includes season-long aggregation of player statistics.
 """
 
-from celery import Celery
+from celery import Celery, chord
+from celery.beat import PersistentScheduler
 from celery.schedules import crontab
+from celery.signals import worker_init
 import os
 import logging
 import asyncio
+import copy
+import gc
+import hashlib
+import threading
+import time
+import redis
 from kncb_html_scraper import KNCBMatchCentreScraper
 from player_aggregator import PlayerSeasonAggregator
 
@@ -47,6 +55,83 @@ app.conf.beat_schedule = {
 
 app.conf.timezone = 'Europe/Amsterdam'
 
+# Worker shape. Scrapes are long and mostly waiting on the network, so a
+# worker takes one message at a time and only acks it once the task has
+# finished (a crashed scrape is redelivered rather than lost). The pool is
+# prefork by default because the scraper drives its own asyncio loop and
+# the aggregator is process-global; CELERY_POOL/CELERY_CONCURRENCY can
+# switch it (e.g. to threads) without code changes.
+app.conf.worker_pool = os.getenv('CELERY_POOL', 'prefork')
+if os.getenv('CELERY_CONCURRENCY'):
+    app.conf.worker_concurrency = int(os.getenv('CELERY_CONCURRENCY'))
+app.conf.worker_prefetch_multiplier = 1
+app.conf.task_acks_late = True
+app.conf.broker_pool_limit = int(os.getenv('CELERY_BROKER_POOL_LIMIT', '50'))
+
+# Redis broker/backend. With late acks, an unacked message is redelivered
+# after the visibility timeout, so it has to outlast the longest scrape.
+# Task events are off (nothing consumes them). Results expire after a few
+# hours rather than a day, but outlive any per-club scrape so the chord
+# that aggregates them can still collect every result.
+app.conf.broker_transport_options = {
+    'visibility_timeout': 7200,  # seconds
+    'socket_keepalive': True,
+    'health_check_interval': 30
+}
+app.conf.result_backend_transport_options = {'retry_on_timeout': True}
+app.conf.worker_send_task_events = False
+app.conf.task_send_sent_event = False
+app.conf.result_expires = 6 * 3600  # seconds
+
+# Each scheduled job gets its own queue so a long scrape can't hold up
+# backups or multiplier updates behind it
+app.conf.task_routes = {
+    'celery_tasks.scrape_kncb_weekly': {'queue': 'scrape'},
+    'celery_tasks.scrape_club_weekly': {'queue': 'scrape'},
+    'celery_tasks.aggregate_weekly_scrape': {'queue': 'scrape'},
+    'celery_tasks.adjust_multipliers_weekly': {'queue': 'multipliers'},
+    'celery_tasks.backup_season_aggregates': {'queue': 'backup'},
+}
+
+
+class HeapCachedScheduler(PersistentScheduler):
+    """
+    Beat scheduler that rebuilds its heap only when the schedule changes
+
+    The stock Scheduler.tick() compares the whole schedule against a copy on
+    every tick to notice changes. Here every path that changes the schedule
+    drops the heap instead, so tick() rebuilds it lazily and otherwise only
+    does heap operations.
+
+    Run beat with: celery -A celery_tasks beat --scheduler celery_tasks:HeapCachedScheduler
+    """
+
+    def setup_schedule(self):
+        super().setup_schedule()
+        self._heap = None
+
+    def update_from_dict(self, dict_):
+        super().update_from_dict(dict_)
+        self._heap = None
+
+    def merge_inplace(self, b):
+        super().merge_inplace(b)
+        self._heap = None
+
+    def schedules_equal(self, old_schedules, new_schedules):
+        # Changes invalidate the heap above, which tick() checks first
+        return True
+
+# Leaderboard payloads are cached in Redis by the stats API and dropped
+# after every scrape so the next request rebuilds them from fresh totals.
+# The last scrape time also seeds the stats API's ETags.
+LEADERBOARD_CACHE_PREFIX = "leaderboards:"
+LEADERBOARD_CACHE_TTL = 60  # seconds
+LAST_SCRAPE_KEY = "stats:last_scrape_ts"
+# Short timeouts so a slow or unreachable Redis costs the stats API its cache
+# rather than hanging requests
+leaderboard_cache = redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+
 # Clubs to scrape (configure these based on your league)
 CONFIGURED_CLUBS = [
     "VRA",
@@ -57,18 +142,80 @@ CONFIGURED_CLUBS = [
     # Add more clubs as needed
 ]
 
+# Season aggregates are persisted in a binary msgpack file; the JSON
+# export is only written on explicit request (see export_season_aggregates_json)
+AGGREGATES_FILE = 'season_aggregates.msgpack'
+LEGACY_AGGREGATES_JSON = 'season_aggregates.json'
+# Digest of the aggregates file at the last dated backup
+LAST_BACKUP_HASH_FILE = '.last_backup_hash'
+
+# Scrapes run on one long-lived event loop in a background thread, so the
+# shared scraper keeps its Playwright driver between tasks. The loop is
+# created lazily per worker process (threads don't survive prefork's fork).
+scraper = KNCBMatchCentreScraper()
+_scrape_loop = None
+_scrape_loop_pid = None
+_scrape_loop_lock = threading.Lock()
+
+
+def run_scrape(coro):
+    """Run a scraper coroutine on this process's scrape loop and wait for the result"""
+    global _scrape_loop, _scrape_loop_pid
+    with _scrape_loop_lock:
+        if _scrape_loop is None or _scrape_loop_pid != os.getpid():
+            _scrape_loop = asyncio.new_event_loop()
+            _scrape_loop_pid = os.getpid()
+            threading.Thread(target=_scrape_loop.run_forever, name="scrape-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _scrape_loop).result()
+
+
 # Global aggregator instance (persists between tasks)
 aggregator = PlayerSeasonAggregator()
 
-# Load previous season data if exists
-aggregator.load_from_file('season_aggregates.json')
+# Load previous season data if exists, falling back to the older JSON file
+if not aggregator.load_from_msgpack(AGGREGATES_FILE):
+    aggregator.load_from_file(LEGACY_AGGREGATES_JSON)
+
+# Anything that mutates or saves the aggregator holds aggregator_lock and
+# then publishes a new snapshot. Leaderboard and summary reads use the
+# snapshot without locking; it is replaced wholesale, never mutated.
+aggregator_lock = threading.RLock()
+SNAPSHOT_TOP_N = 50  # matches the stats API's largest leaderboard limit
+SNAPSHOT_METRICS = ('fantasy_points', 'runs', 'wickets')
+_snapshot = {'version': 0, 'summary': {}, 'top': {}}
+
+
+def publish_snapshot():
+    """Publish a read-only copy of the season summary and leaderboards (hold aggregator_lock)"""
+    global _snapshot
+    _snapshot = {
+        'version': _snapshot['version'] + 1,
+        'summary': aggregator.get_season_summary(),
+        'top': {
+            metric: tuple(copy.deepcopy(aggregator.get_top_players(SNAPSHOT_TOP_N, sort_by=metric)))
+            for metric in SNAPSHOT_METRICS
+        }
+    }
 
 # Load legacy rosters (from previous season)
+def legacy_roster_manifest(roster_files) -> str:
+    """Hash of the roster files' names, sizes and modification times"""
+    digest = hashlib.blake2b(digest_size=16)
+    for roster_file in sorted(roster_files):
+        stat = os.stat(roster_file)
+        digest.update(f"{roster_file}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
 def load_legacy_rosters():
-    """Load legacy player rosters from previous season"""
+    """
+    Load legacy player rosters from previous season
+
+    Skipped when the roster files match the manifest stored with the saved
+    season aggregates, i.e. they were already imported into them.
+    """
     from legacy_roster_loader import LegacyRosterLoader
     import glob
-    import os
 
     loader = LegacyRosterLoader()
     total_imported = 0
@@ -80,6 +227,11 @@ def load_legacy_rosters():
         logger.info("ℹ️  No legacy rosters found")
         return 0
 
+    manifest = legacy_roster_manifest(roster_files)
+    if manifest == aggregator.legacy_manifest:
+        logger.info("ℹ️  Legacy rosters unchanged since last import, skipping")
+        return 0
+
     logger.info(f"📥 Loading legacy rosters from {len(roster_files)} file(s)...")
 
     for roster_file in roster_files:
@@ -90,85 +242,116 @@ def load_legacy_rosters():
         count = loader.import_to_aggregator(aggregator, legacy_players)
         total_imported += count
 
+    # Persisted with the aggregates on the next save
+    aggregator.legacy_manifest = manifest
+
     logger.info(f"✅ Legacy roster loading complete: {total_imported} players imported")
     return total_imported
 
 # Load legacy rosters on startup
-legacy_count = load_legacy_rosters()
+with aggregator_lock:
+    legacy_count = load_legacy_rosters()
+    publish_snapshot()
+
+
+@worker_init.connect
+def freeze_loaded_aggregates(**kwargs):
+    """
+    Freeze everything loaded at import before the prefork pool forks
+
+    Pool children inherit the loaded aggregates and snapshot, so they never
+    re-parse them. Moving those objects into the GC's permanent generation
+    stops collections in the children from writing to them, which would
+    otherwise copy the shared memory pages into every child.
+    """
+    gc.freeze()
 
 
 @app.task(name='celery_tasks.scrape_kncb_weekly')
-def scrape_kncb_weekly():
+def scrape_kncb_weekly(days_back: int = 7):
     """
     Scrape KNCB match data weekly and aggregate player stats
     Runs every Monday at 1 AM (after weekend matches)
 
     This task:
-    1. Scrapes recent matches for configured clubs
+    1. Scrapes recent matches for each configured club in parallel
+       (one scrape_club_weekly task per club)
     2. Extracts player performances
-    3. Updates season aggregates (cumulative totals)
+    3. Updates season aggregates (cumulative totals) once every club is done
     4. Saves aggregated data
     5. Syncs to database
-    """
-    logger.info("🏏 Starting weekly KNCB scrape with aggregation...")
 
-    try:
-        # Run async scraper
-        loop = asyncio.get_event_loop()
-        scraper = KNCBMatchCentreScraper()
-
-        results = loop.run_until_complete(
-            scraper.scrape_weekly_update(CONFIGURED_CLUBS, days_back=7)
-        )
+    Steps 3-5 run in aggregate_weekly_scrape as the chord callback.
+    """
+    logger.info(f"🏏 Starting weekly KNCB scrape for {len(CONFIGURED_CLUBS)} clubs...")
 
-        logger.info(f"✅ Scrape complete! {results['total_performances']} performances")
+    result = chord(
+        scrape_club_weekly.s(club, days_back) for club in CONFIGURED_CLUBS
+    )(aggregate_weekly_scrape.s())
 
-        # Aggregate all performances into season totals
-        logger.info("📊 Aggregating player statistics...")
+    return {
+        "status": "started",
+        "aggregate_task_id": result.id,
+        "clubs": CONFIGURED_CLUBS
+    }
 
-        new_players = 0
-        updated_players = 0
 
-        for performance in results['performances']:
-            player_id = performance.get('player_id')
+@app.task(name='celery_tasks.scrape_club_weekly')
+def scrape_club_weekly(club: str, days_back: int = 7):
+    """
+    Scrape one club's recent matches
+    Part of the weekly scrape; errors are returned rather than raised so
+    one failing club doesn't stop the others from being aggregated
+    """
+    try:
+        return run_scrape(scraper.scrape_weekly_update([club], days_back=days_back))
 
-            # Check if new player
-            was_new = player_id not in aggregator.players
+    except Exception as e:
+        logger.error(f"❌ Scrape failed for {club}: {e}")
+        return {"status": "error", "clubs": [club], "error": str(e)}
 
-            # Add/update performance
-            aggregator.add_match_performance(performance)
 
-            if was_new:
-                new_players += 1
-            else:
-                updated_players += 1
-
-        logger.info(f"🆕 New players discovered: {new_players}")
-        logger.info(f"🔄 Existing players updated: {updated_players}")
+@app.task(name='celery_tasks.aggregate_weekly_scrape')
+def aggregate_weekly_scrape(club_results: list):
+    """
+    Fold the per-club weekly scrape results into the season aggregates
+    """
+    try:
+        failed = [r['clubs'][0] for r in club_results if r.get('status') == 'error']
+        if failed:
+            logger.warning(f"⚠️  Scrape failed for: {', '.join(failed)}")
 
-        # Save aggregated data to file
-        aggregator.save_to_file('season_aggregates.json')
+        performances = [p for r in club_results for p in r.get('performances', [])]
+        clubs = [c for r in club_results if r.get('status') != 'error' for c in r['clubs']]
 
-        # Get summary
-        summary = aggregator.get_season_summary()
+        # Aggregate all performances into season totals
+        with aggregator_lock:
+            counts = aggregator.add_batch(performances)
 
-        logger.info(f"\n📈 Season Summary:")
-        logger.info(f"   Total players: {summary['total_players']}")
-        logger.info(f"   Clubs: {summary['clubs']}")
+            # Save aggregated data to file
+            aggregator.save_to_msgpack(AGGREGATES_FILE)
+            publish_snapshot()
+        record_scrape_completed()
 
         # TODO: Sync to database
         # db_data = aggregator.export_to_database_format()
         # sync_to_database(db_data)
 
-        return {
+        scrape_summary = {
             "status": "success",
-            "performances_scraped": results['total_performances'],
-            "new_players": new_players,
-            "updated_players": updated_players,
-            "total_players": summary['total_players'],
-            "clubs": results['clubs']
+            "performances_scraped": len(performances),
+            "new_players": counts['new_players'],
+            "updated_players": counts['updated_players'],
+            "total_players": _snapshot['summary']['total_players'],
+            "clubs": clubs,
+            "failed_clubs": failed
         }
 
+        # One structured record for the whole run, also the task result
+        logger.info("📈 Weekly scrape aggregated: %s", scrape_summary,
+                    extra={'scrape_summary': scrape_summary})
+        return scrape_summary
+
     except Exception as e:
         logger.error(f"❌ Weekly scrape failed: {e}")
         import traceback
@@ -186,14 +369,33 @@ def backup_season_aggregates():
 
     try:
         # Save to file
-        aggregator.save_to_file('season_aggregates.json')
+        with aggregator_lock:
+            digest = aggregator.save_to_msgpack(AGGREGATES_FILE)
 
-        # Also create dated backup
+        summary = _snapshot['summary']
+
+        # Skip the dated backup when nothing changed since the last one
+        try:
+            with open(LAST_BACKUP_HASH_FILE) as f:
+                last_digest = f.read().strip()
+        except FileNotFoundError:
+            last_digest = None
+
+        if digest == last_digest:
+            logger.info("✅ Season aggregates unchanged since last backup, skipping")
+            return {"status": "unchanged", "players_backed_up": 0}
+
+        # Also create dated backup: a hard link to the file just written
+        # (save_to_msgpack replaces rather than rewrites, so the link keeps
+        # today's contents) instead of serializing everything twice
         from datetime import datetime
-        backup_filename = f"season_aggregates_backup_{datetime.now().strftime('%Y%m%d')}.json"
-        aggregator.save_to_file(backup_filename)
+        backup_filename = f"season_aggregates_backup_{datetime.now().strftime('%Y%m%d')}.msgpack"
+        if os.path.exists(backup_filename):
+            os.remove(backup_filename)
+        os.link(AGGREGATES_FILE, backup_filename)
 
-        summary = aggregator.get_season_summary()
+        with open(LAST_BACKUP_HASH_FILE, 'w') as f:
+            f.write(digest)
 
         logger.info(f"✅ Backup complete!")
         logger.info(f"   Players: {summary['total_players']}")
@@ -208,6 +410,24 @@ def backup_season_aggregates():
         return {"status": "error", "error": str(e)}
 
 
+@app.task(name='celery_tasks.export_season_aggregates_json')
+def export_season_aggregates_json(filename: str = LEGACY_AGGREGATES_JSON):
+    """
+    Export season aggregates as human-readable JSON
+    Only runs when triggered manually
+    """
+    logger.info(f"📤 Exporting season aggregates to {filename}...")
+
+    try:
+        with aggregator_lock:
+            aggregator.save_to_file(filename)
+        return {"status": "success", "filename": filename}
+
+    except Exception as e:
+        logger.error(f"❌ JSON export failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+
 @app.task(name='celery_tasks.scrape_single_match')
 def scrape_single_match(match_id: int):
     """
@@ -217,10 +437,7 @@ def scrape_single_match(match_id: int):
     logger.info(f"📥 Scraping match {match_id}...")
 
     try:
-        loop = asyncio.get_event_loop()
-        scraper = KNCBMatchCentreScraper()
-
-        scorecard = loop.run_until_complete(
+        scorecard = run_scrape(
             scraper.scrape_match_scorecard(match_id)
         )
 
@@ -401,34 +618,63 @@ def update_fantasy_team_points(league_id: str = None):
 # DATA ACCESS HELPERS
 # =============================================================================
 
+def invalidate_leaderboard_cache():
+    """Drop every cached leaderboard payload"""
+    try:
+        keys = list(leaderboard_cache.scan_iter(match=f"{LEADERBOARD_CACHE_PREFIX}*"))
+        if keys:
+            leaderboard_cache.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"⚠️  Could not clear leaderboard cache: {e}")
+
+
+def record_scrape_completed():
+    """Bump the last scrape time (changing every stats ETag) and drop cached leaderboards"""
+    try:
+        leaderboard_cache.set(LAST_SCRAPE_KEY, time.time())
+    except redis.RedisError as e:
+        logger.warning(f"⚠️  Could not record scrape time: {e}")
+    invalidate_leaderboard_cache()
+
+
 def get_player_stats(player_id: str) -> dict:
     """Get season stats for a specific player"""
-    return aggregator.get_player(player_id)
+    with aggregator_lock:
+        return aggregator.get_player(player_id)
+
 
+def get_club_roster(club_name: str, limit: int = None) -> list:
+    """Get players for a specific club (at most limit, if given)"""
+    with aggregator_lock:
+        return aggregator.get_players_by_club(club_name, limit)
 
-def get_club_roster(club_name: str) -> list:
-    """Get all players for a specific club"""
-    return aggregator.get_players_by_club(club_name)
+
+def _top_players(limit: int, sort_by: str) -> list:
+    """Top players from the published snapshot, or the aggregator beyond its depth"""
+    if limit <= SNAPSHOT_TOP_N:
+        return list(_snapshot['top'][sort_by][:limit])
+    with aggregator_lock:
+        return aggregator.get_top_players(limit, sort_by=sort_by)
 
 
 def get_top_fantasy_scorers(limit: int = 10) -> list:
     """Get top fantasy point scorers"""
-    return aggregator.get_top_players(limit, sort_by='fantasy_points')
+    return _top_players(limit, 'fantasy_points')
 
 
 def get_top_run_scorers(limit: int = 10) -> list:
     """Get top run scorers"""
-    return aggregator.get_top_players(limit, sort_by='runs')
+    return _top_players(limit, 'runs')
 
 
 def get_top_wicket_takers(limit: int = 10) -> list:
     """Get top wicket takers"""
-    return aggregator.get_top_players(limit, sort_by='wickets')
+    return _top_players(limit, 'wickets')
 
 
 def get_season_summary() -> dict:
     """Get overall season summary"""
-    return aggregator.get_season_summary()
+    return _snapshot['summary']
 
 
 # =============================================================================
@@ -447,6 +693,12 @@ def trigger_backup_now():
     return result.id
 
 
+def trigger_json_export_now():
+    """Manually trigger a JSON export of the season aggregates"""
+    result = export_season_aggregates_json.delay()
+    return result.id
+
+
 if __name__ == "__main__":
     print("🔧 Celery Tasks Configuration with Aggregation")
     print("=" * 70)
@@ -456,16 +708,16 @@ if __name__ == "__main__":
     print(f"\n🏏 Configured clubs: {', '.join(CONFIGURED_CLUBS)}")
 
     # Show current season stats if available
-    summary = aggregator.get_season_summary()
+    summary = get_season_summary()
     if summary['total_players'] > 0:
         print(f"\n📊 Current Season Stats:")
         print(f"   Total players: {summary['total_players']}")
         print(f"   Clubs: {summary['clubs']}")
         print(f"\n🏆 Top 5 Fantasy Scorers:")
-        for player in aggregator.get_top_players(5):
+        for player in get_top_fantasy_scorers(5):
             print(f"      {player['player_name']}: {player['season_totals']['fantasy_points']} pts")
 
     print("\n✅ Celery tasks ready!")
     print("\nTo start Celery:")
-    print("   celery -A celery_tasks worker --loglevel=info")
-    print("   celery -A celery_tasks beat --loglevel=info")
+    print("   celery -A celery_tasks worker --loglevel=info -Q celery,scrape,multipliers,backup")
+    print("   celery -A celery_tasks beat --loglevel=info --scheduler celery_tasks:HeapCachedScheduler")
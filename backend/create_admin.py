@@ -16,12 +16,11 @@ from getpass import getpass
 from datetime import datetime
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from passlib.context import CryptContext
 
 # Import User model from centralized database schema
 from database_models import User
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hash the same way as registration/login
+from user_auth_endpoints import hash_password
 
 def create_admin_user(email: str, full_name: str, password: str, database_url: str):
     """Create an admin user in the database"""
@@ -51,7 +50,7 @@ def create_admin_user(email: str, full_name: str, password: str, database_url: s
             return
 
         # Hash the password
-        password_hash = pwd_context.hash(password)
+        password_hash = hash_password(password)
 
         # Create new admin user
         admin_user = User(
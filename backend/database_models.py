@@ -7,10 +7,10 @@ SQLAlchemy models for seasons, clubs, teams, players, leagues, and fantasy teams
 
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey,
-    JSON, UniqueConstraint, Index
+    JSON, UniqueConstraint, Index, Computed, select, func
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from datetime import datetime
 import uuid
 
@@ -154,6 +154,8 @@ class Player(Base):
 
     id = Column(String(50), primary_key=True, default=generate_uuid)
     name = Column(String(200), nullable=False)
+    # Lowercased, space-stripped name maintained by Postgres for duplicate detection
+    normalized_name = Column(String(200), Computed("lower(replace(name, ' ', ''))", persisted=True))
     club_id = Column(String(50), ForeignKey("clubs.id"), nullable=False)
 
     # Real-life team assignment (e.g., "ACC 1", "ACC ZAMI", "U17")
@@ -198,6 +200,8 @@ class Player(Base):
     # Indexes
     __table_args__ = (
         Index('idx_player_club', 'club_id'),
+        Index('idx_player_club_role_multiplier', 'club_id', 'role', 'multiplier'),
+        Index('idx_player_club_normalized_name', 'club_id', 'normalized_name'),
     )
 
 
@@ -374,7 +378,7 @@ class FantasyTeam(Base):
     __table_args__ = (
         UniqueConstraint('league_id', 'user_id', name='uq_league_user'),
         Index('idx_fantasy_team_league', 'league_id'),
-        Index('idx_fantasy_team_user', 'user_id'),
+        Index('idx_fantasy_team_user_league', 'user_id', 'league_id'),  # "my teams/leagues" lookups
     )
 
 
@@ -413,6 +417,17 @@ class FantasyTeamPlayer(Base):
     )
 
 
+# Number of players in a fantasy team, as a correlated COUNT. Deferred so it
+# only runs when a query asks for it with undefer(FantasyTeam.player_count).
+FantasyTeam.player_count = column_property(
+    select(func.count(FantasyTeamPlayer.id))
+    .where(FantasyTeamPlayer.fantasy_team_id == FantasyTeam.id)
+    .correlate_except(FantasyTeamPlayer)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
 class Transfer(Base):
     """
     Transfer history for fantasy teams
@@ -104,10 +104,23 @@ class KNCBMatchCentreScraper:
         # Fantasy points configuration - imported from centralized rules-set-1.py
         self.rules = FANTASY_RULES
 
+        # Playwright driver, started on first use and reused on the same loop
+        self._playwright = None
+        self._playwright_loop = None
+
     async def create_browser(self) -> Browser:
-        """Create browser instance"""
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
+        """
+        Create browser instance
+
+        The Playwright driver is started once per event loop and shared by
+        every browser this scraper launches on it, instead of spawning (and
+        leaking) a new driver for each call.
+        """
+        loop = asyncio.get_running_loop()
+        if self._playwright is None or self._playwright_loop is not loop:
+            self._playwright = await async_playwright().start()
+            self._playwright_loop = loop
+        browser = await self._playwright.chromium.launch(
             headless=True,
             args=['--disable-blink-features=AutomationControlled']
         )
@@ -4,17 +4,20 @@ League Management Endpoints
 Admin endpoints for creating and managing fantasy leagues
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional
+from datetime import datetime
 from database import get_db
 from database_models import League, Season, FantasyTeam, Transfer, Club, Player, LeagueRoster
 from uuid import uuid4
 from admin_endpoints import verify_admin
 from team_validation import validate_team_composition, get_team_composition_summary
-import secrets
-import string
+import base64
+import os
 
 router = APIRouter(prefix="/api/admin", tags=["leagues"])
 
@@ -54,18 +57,47 @@ class GrantTransferRequest(BaseModel):
     extra_transfers: int = 1
 
 
+class LeagueSummary(BaseModel):
+    """League row in the admin league list"""
+    id: str
+    season_id: str
+    season_name: str
+    club_id: str
+    club_name: str
+    name: str
+    description: Optional[str] = None
+    league_code: str
+    squad_size: Optional[int] = None
+    transfers_per_season: Optional[int] = None
+    require_from_each_team: Optional[bool] = None
+    is_public: Optional[bool] = None
+    participants_count: int
+    max_participants: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+
+class LeagueList(BaseModel):
+    leagues: List[LeagueSummary]
+
+
+_league_list_adapter = TypeAdapter(LeagueList)
+
+
 # =============================================================================
 # LEAGUE MANAGEMENT ENDPOINTS
 # =============================================================================
 
+LEAGUE_CODE_ATTEMPTS = 5
+
+
 def generate_league_code() -> str:
-    """Generate a random 6-character league code"""
-    characters = string.ascii_uppercase + string.digits
-    return ''.join(secrets.choice(characters) for _ in range(6))
+    """Generate a random 6-character league code (base32 alphabet: A-Z, 2-7)"""
+    # 5 random bytes encode to 8 base32 characters without padding
+    return base64.b32encode(os.urandom(5))[:6].decode('ascii')
 
 
 @router.post("/leagues", status_code=status.HTTP_201_CREATED)
-async def create_league(
+def create_league(
     league_data: LeagueCreate,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -94,18 +126,14 @@ async def create_league(
 
     logger.info(f"Found club: {club.name} ({club.id})")
 
-    # Generate unique league code
-    league_code = generate_league_code()
-    while db.query(League).filter_by(league_code=league_code).first():
-        league_code = generate_league_code()
-
-    # Create league
+    # Create league. The unique constraint on league_code decides collisions,
+    # so a clashing code is regenerated on IntegrityError instead of being
+    # pre-checked with a SELECT.
     league = League(
         season_id=league_data.season_id,
         club_id=league_data.club_id,
         name=league_data.name,
         description=league_data.description,
-        league_code=league_code,
         squad_size=league_data.squad_size,
         transfers_per_season=league_data.transfers_per_season,
         require_from_each_team=league_data.require_from_each_team,
@@ -114,31 +142,37 @@ async def create_league(
         created_by=admin["user_id"]
     )
 
-    db.add(league)
-    db.commit()
-    db.refresh(league)
+    for attempt in range(1, LEAGUE_CODE_ATTEMPTS + 1):
+        league.league_code = generate_league_code()
+        db.add(league)
+        try:
+            db.commit()
+            break
+        except IntegrityError as e:
+            db.rollback()
+            if "league_code" not in str(e.orig) or attempt == LEAGUE_CODE_ATTEMPTS:
+                raise
+            logger.warning(f"League code collision on attempt {attempt}, regenerating")
 
     # Populate league roster with players
     # Senior teams are always included
     senior_teams = ["ACC 1", "ACC 2", "ACC 3", "ACC 4", "ACC 5", "ACC 6", "ZAMI 1"]
     included_teams = senior_teams + league_data.youth_teams
 
-    # Get all players from included teams
-    players = db.query(Player).filter(
+    # Get all player IDs from included teams
+    player_ids = db.query(Player.id).filter(
         Player.club_id == league_data.club_id,
         Player.rl_team.in_(included_teams)
     ).all()
 
-    # Create LeagueRoster entries
-    roster_count = 0
-    for player in players:
-        roster_entry = LeagueRoster(
-            id=str(uuid4()),
-            league_id=league.id,
-            player_id=player.id
-        )
-        db.add(roster_entry)
-        roster_count += 1
+    # Create LeagueRoster entries in a single multi-row INSERT
+    roster_rows = [
+        {"id": str(uuid4()), "league_id": league.id, "player_id": player_id}
+        for (player_id,) in player_ids
+    ]
+    if roster_rows:
+        db.execute(insert(LeagueRoster), roster_rows)
+    roster_count = len(roster_rows)
 
     db.commit()
 
@@ -158,40 +192,49 @@ async def create_league(
 
 
 @router.get("/leagues")
-async def list_leagues(
+def list_leagues(
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
 ):
     """List all leagues (Admin only)"""
 
-    leagues = db.query(League).order_by(League.created_at.desc()).all()
+    # Select exactly the response fields (names joined in, participants
+    # counted in SQL) so no League objects or collections are hydrated
+    participants_count = (
+        select(func.count(FantasyTeam.id))
+        .where(FantasyTeam.league_id == League.id)
+        .correlate(League)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            League.id,
+            League.season_id,
+            func.coalesce(Season.name, "Unknown").label("season_name"),
+            League.club_id,
+            func.coalesce(Club.name, "Unknown").label("club_name"),
+            League.name,
+            League.description,
+            League.league_code,
+            League.squad_size,
+            League.transfers_per_season,
+            League.require_from_each_team,
+            League.is_public,
+            participants_count.label("participants_count"),
+            League.max_participants,
+            League.created_at
+        )
+        .outerjoin(Season, Season.id == League.season_id)
+        .outerjoin(Club, Club.id == League.club_id)
+        .order_by(League.created_at.desc())
+    ).mappings()
 
-    return {
-        "leagues": [
-            {
-                "id": l.id,
-                "season_id": l.season_id,
-                "season_name": l.season.name if l.season else "Unknown",
-                "club_id": l.club_id,
-                "club_name": l.club.name if l.club else "Unknown",
-                "name": l.name,
-                "description": l.description,
-                "league_code": l.league_code,
-                "squad_size": l.squad_size,
-                "transfers_per_season": l.transfers_per_season,
-                "require_from_each_team": l.require_from_each_team,
-                "is_public": l.is_public,
-                "participants_count": len(l.fantasy_teams),
-                "max_participants": l.max_participants,
-                "created_at": l.created_at.isoformat()
-            }
-            for l in leagues
-        ]
-    }
+    payload = _league_list_adapter.validate_python({"leagues": [dict(row) for row in rows]})
+    return Response(content=_league_list_adapter.dump_json(payload), media_type="application/json")
 
 
 @router.get("/leagues/{league_id}")
-async def get_league(
+def get_league(
     league_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -246,7 +289,7 @@ async def get_league(
 
 
 @router.patch("/leagues/{league_id}")
-async def update_league(
+def update_league(
     league_id: str,
     league_data: LeagueUpdate,
     admin: dict = Depends(verify_admin),
@@ -283,7 +326,6 @@ async def update_league(
         league.max_players_per_team = league_data.max_players_per_team
 
     db.commit()
-    db.refresh(league)
 
     return {
         "message": "League updated successfully",
@@ -305,7 +347,7 @@ async def update_league(
 
 
 @router.post("/leagues/{league_id}/teams/{team_id}/grant-transfer")
-async def grant_extra_transfer(
+def grant_extra_transfer(
     league_id: str,
     team_id: str,
     request: GrantTransferRequest,
@@ -344,7 +386,7 @@ async def grant_extra_transfer(
 
 
 @router.get("/leagues/{league_id}/transfer-requests")
-async def get_transfer_requests(
+def get_transfer_requests(
     league_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -388,7 +430,7 @@ async def get_transfer_requests(
 
 
 @router.post("/leagues/{league_id}/transfer-requests/{transfer_id}/approve")
-async def approve_transfer_request(
+def approve_transfer_request(
     league_id: str,
     transfer_id: str,
     admin: dict = Depends(verify_admin),
@@ -423,7 +465,7 @@ async def approve_transfer_request(
 
 
 @router.get("/leagues/{league_id}/teams/{team_id}/validate")
-async def validate_fantasy_team(
+def validate_fantasy_team(
     league_id: str,
     team_id: str,
     admin: dict = Depends(verify_admin),
@@ -477,7 +519,7 @@ async def validate_fantasy_team(
 # =============================================================================
 
 @router.post("/leagues/{league_id}/confirm")
-async def confirm_league(
+def confirm_league(
     league_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -514,7 +556,7 @@ async def confirm_league(
 
 
 @router.post("/leagues/{league_id}/lock")
-async def lock_league(
+def lock_league(
     league_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -547,7 +589,7 @@ async def lock_league(
 
 
 @router.post("/leagues/{league_id}/complete")
-async def complete_league(
+def complete_league(
     league_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -571,7 +613,7 @@ async def complete_league(
 
 
 @router.get("/leagues/{league_id}/status")
-async def get_league_status_endpoint(
+def get_league_status_endpoint(
     league_id: str,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
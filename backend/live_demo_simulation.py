@@ -23,6 +23,7 @@ import uuid
 from datetime import datetime
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from database import refresh_league_player_stats
 from playwright.async_api import async_playwright
 import re
 import logging
@@ -327,6 +328,9 @@ def store_performances(performances, round_number, league_id):
         session.commit()
         print(f"✅ Stored {len(performances)} performances for Round {round_number}")
 
+        # Per-league totals served by the league stats endpoint
+        refresh_league_player_stats(session)
+
     except Exception as e:
         session.rollback()
         logger.error(f"Error storing performances: {e}")
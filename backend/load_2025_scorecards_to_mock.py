@@ -14,14 +14,20 @@ Strategy:
 import requests
 import json
 import os
+import queue
+import random
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List
-from acc_2025_matches import ALL_2025_MATCHES
+from acc_2025_matches import ALL_2025_MATCHES, url_of
 
 # Configuration
 MOCK_DATA_DIR = "./mock_data/scorecards_2026"
 BATCH_SIZE = 10  # Process 10 matches at a time
-DELAY_BETWEEN_REQUESTS = 1  # seconds
+DELAY_BETWEEN_REQUESTS = 1  # seconds (minimum spacing between requests)
+MAX_RETRIES = 4  # retries on 429/503 before giving up on a match
+MAX_BACKOFF = 60  # seconds
 
 # Colors for output
 class Colors:
@@ -55,10 +61,44 @@ def create_directories():
     print_success(f"Created directories in {MOCK_DATA_DIR}")
 
 
+class RequestPacer:
+    """
+    Spaces requests at least min_interval apart, measured from the last
+    response rather than slept after it, and honours Retry-After when
+    the server asks us to slow down.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.next_allowed = 0.0
+
+    def wait(self):
+        """Sleep until the next request is allowed"""
+        delay = self.next_allowed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(self, response: requests.Response, backoff: float = 0.0):
+        """Schedule the next request from a response's headers"""
+        delay = max(self.min_interval, backoff)
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+
+        self.next_allowed = time.monotonic() + delay
+
+
+pacer = RequestPacer(DELAY_BETWEEN_REQUESTS)
+
+
 def fetch_scorecard(url: str) -> Dict:
     """
     Fetch a scorecard from the real KNCB API
 
+    Rate-limited responses (429/503) are retried with exponential backoff
+    and jitter, or after the server's Retry-After if that is longer.
+
     Args:
         url: Full scorecard URL from matchcentre.kncb.nl
 
@@ -66,7 +106,19 @@ def fetch_scorecard(url: str) -> Dict:
         Dict containing scorecard HTML and metadata
     """
     try:
-        response = requests.get(url, timeout=30)
+        for attempt in range(MAX_RETRIES + 1):
+            pacer.wait()
+            response = requests.get(url, timeout=30)
+
+            if response.status_code in (429, 503) and attempt < MAX_RETRIES:
+                backoff = min(MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+                pacer.record(response, backoff=backoff)
+                print_warning(f"Rate limited ({response.status_code}), retrying...")
+                continue
+
+            pacer.record(response)
+            break
+
         response.raise_for_status()
 
         return {
@@ -109,15 +161,6 @@ def map_2025_to_2026_date(period_id: int) -> str:
     return match_date.strftime("%Y-%m-%d")
 
 
-def extract_period_id(url: str) -> int:
-    """Extract period ID from URL"""
-    try:
-        period_str = url.split('period=')[1]
-        return int(period_str)
-    except:
-        return 0
-
-
 def assign_week_number(date_str: str) -> int:
     """Assign week number based on date (1-12 weeks for April-September)"""
     match_date = datetime.strptime(date_str, "%Y-%m-%d")
@@ -134,7 +177,7 @@ def process_match(match: Dict, index: int, total: int) -> Dict:
     Process a single match: fetch scorecard and prepare for 2026
 
     Args:
-        match: Match dict with match_id, team, url
+        match: Match dict with match_id, team, period
         index: Current match number
         total: Total matches
 
@@ -144,14 +187,15 @@ def process_match(match: Dict, index: int, total: int) -> Dict:
     print(f"\n[{index}/{total}] Processing {match['team']} - Match {match['match_id']}")
 
     # Fetch scorecard
-    print(f"   Fetching from: {match['url']}")
-    scorecard = fetch_scorecard(match['url'])
+    url = url_of(match)
+    print(f"   Fetching from: {url}")
+    scorecard = fetch_scorecard(url)
 
     if not scorecard:
         return None
 
-    # Extract period ID and map to 2026 date
-    period_id = extract_period_id(match['url'])
+    # Map period ID to 2026 date
+    period_id = match['period']
     date_2026 = map_2025_to_2026_date(period_id)
     week_number = assign_week_number(date_2026)
 
@@ -162,7 +206,7 @@ def process_match(match: Dict, index: int, total: int) -> Dict:
     processed = {
         'match_id': match['match_id'],
         'team': match['team'],
-        'original_url_2025': match['url'],
+        'original_url_2025': url,
         'period_id_2025': period_id,
         'mapped_date_2026': date_2026,
         'week_number': week_number,
@@ -213,6 +257,41 @@ def save_match_data(match_data: Dict):
         json.dump(week_matches, f, indent=2)
 
 
+class MatchWriter:
+    """
+    Single background thread that saves processed matches to disk
+
+    Fetching is network bound and saving rewrites the growing team/week
+    files, so the writes are moved off the fetch loop. A single writer
+    keeps the read-modify-write of those files sequential.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.failed = []
+
+    def start(self):
+        self._thread.start()
+
+    def put(self, match_data: Dict):
+        """Queue a processed match for saving (blocks if the queue is full)"""
+        self._queue.put(match_data)
+
+    def close(self):
+        """Flush all queued matches and stop the writer thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while (match_data := self._queue.get()) is not None:
+            try:
+                save_match_data(match_data)
+            except Exception as e:
+                print_error(f"Failed to save match {match_data['match_id']}: {str(e)}")
+                self.failed.append(match_data)
+
+
 def create_index_file(all_matches: List[Dict]):
     """Create master index file with all matches"""
     index = {
@@ -303,8 +382,6 @@ def generate_statistics(all_matches: List[Dict]):
 
 def main():
     """Main execution function"""
-    import time
-
     print_header("🏏 Load 2025 Scorecards to Mock Server (as 2026 data)")
 
     print(f"📋 Configuration:")
@@ -339,22 +416,21 @@ def main():
     processed_matches = []
     failed_matches = []
 
+    writer = MatchWriter()
+    writer.start()
+
     for i, match in enumerate(ALL_2025_MATCHES, 1):
         try:
             processed = process_match(match, i, len(ALL_2025_MATCHES))
 
             if processed:
-                save_match_data(processed)
+                writer.put(processed)
                 processed_matches.append(processed)
-                print_success(f"Saved match {match['match_id']}")
+                print_success(f"Processed match {match['match_id']}")
             else:
                 failed_matches.append(match)
                 print_error(f"Failed to process match {match['match_id']}")
 
-            # Rate limiting
-            if i < len(ALL_2025_MATCHES):
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-
             # Progress update every 10 matches
             if i % 10 == 0:
                 print(f"\n📊 Progress: {i}/{len(ALL_2025_MATCHES)} ({i*100//len(ALL_2025_MATCHES)}%)")
@@ -368,6 +444,13 @@ def main():
             print_error(f"Unexpected error: {str(e)}")
             failed_matches.append(match)
 
+    # Wait for queued matches to be written
+    writer.close()
+    if writer.failed:
+        failed_ids = {m['match_id'] for m in writer.failed}
+        processed_matches = [m for m in processed_matches if m['match_id'] not in failed_ids]
+        failed_matches.extend(writer.failed)
+
     # Create index
     if processed_matches:
         print()
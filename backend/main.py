@@ -16,26 +16,29 @@ from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, D
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.exc import ProgrammingError
 from pydantic import BaseModel, EmailStr, validator, field_serializer
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from enum import Enum
-from jose import jwt, JWTError
+import jwt
 import uuid
 import redis
 import os
 import logging
 from celery import Celery
 from celery.schedules import crontab
+from anyio import to_thread
 
 # Import routers
 from api_endpoints import router as stats_router
-from admin_endpoints import router as admin_router
+from admin_endpoints import router as admin_router, value_error_handler
 from league_endpoints import router as league_router
 from player_endpoints import router as player_router
 from user_auth_endpoints import router as auth_router
 from user_team_endpoints import router as user_team_router
+from database import DB_POOL_SIZE, DB_MAX_OVERFLOW, warm_pool, pool_status
 
 # Import all models from database_models (centralized schema)
 from database_models import (
@@ -215,6 +218,9 @@ app.add_middleware(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Service-level validation errors (e.g. duplicate season) -> 400
+app.add_exception_handler(ValueError, value_error_handler)
+
 security = HTTPBearer()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -226,6 +232,27 @@ app.include_router(player_router)
 app.include_router(auth_router)
 app.include_router(user_team_router)
 
+@app.on_event("startup")
+async def size_threadpool():
+    """
+    Match the sync-endpoint threadpool to the database pool.
+
+    Every database-bound handler uses the synchronous session and runs
+    in AnyIO's worker threads. With more threads than connections, the
+    surplus threads sit blocked in pool checkout (up to pool_timeout)
+    instead of the requests waiting cheaply on the event loop.
+    """
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    logger.info(f"Threadpool sized to {limiter.total_tokens} workers")
+
+
+@app.on_event("startup")
+async def warm_db_pool():
+    """Open the database pool's connections before the first request arrives."""
+    opened = await to_thread.run_sync(warm_pool)
+    logger.info(f"Database pool warmed with {opened} connections")
+
 # =============================================================================
 # DEPENDENCIES
 # =============================================================================
@@ -252,7 +279,7 @@ def get_current_user(
             raise HTTPException(status_code=401, detail="User not found")
         
         return user
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 # =============================================================================
@@ -265,6 +292,7 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat(),
         "environment": ENVIRONMENT,
+        "database_pool": pool_status(),
         "location": "Amsterdam, Netherlands",
         "powered_by": "LeafCloud sustainable infrastructure"
     }
@@ -272,7 +300,7 @@ async def health_check():
 # Auth endpoints moved to user_auth_endpoints.py router
 
 @app.get("/api/leagues/{league_id}/players")
-async def get_league_players(
+def get_league_players(
     league_id: str,
     include_pricing: bool = Query(False, description="Include admin pricing data"),
     current_user: User = Depends(get_current_user),
@@ -306,7 +334,7 @@ async def get_league_players(
     return [PlayerResponse.from_orm(player) for player in players]
 
 @app.get("/api/leagues/{league_id}/leaderboard")
-async def get_leaderboard(
+def get_leaderboard(
     league_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -335,7 +363,7 @@ async def get_leaderboard(
     return result
 
 @app.get("/api/leagues/{league_id}/teams/{team_id}")
-async def get_league_team_details(
+def get_league_team_details(
     league_id: str,
     team_id: str,
     current_user: User = Depends(get_current_user),
@@ -384,7 +412,7 @@ async def get_league_team_details(
     }
 
 @app.get("/api/leagues/{league_id}/teams/{team_id}/detailed")
-async def get_team_detailed_stats(
+def get_team_detailed_stats(
     league_id: str,
     team_id: str,
     match_count: int = 3,  # Default to last 3 matches, configurable
@@ -636,7 +664,7 @@ async def get_team_detailed_stats(
     }
 
 @app.get("/api/leagues/{league_id}/stats")
-async def get_league_stats(
+def get_league_stats(
     league_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -690,9 +718,18 @@ async def get_league_stats(
     # Use raw SQL since the PlayerPerformance model may not match the table schema
     player_stats_agg = {}
 
-    # Query player_performances table directly with raw SQL
+    # Per-player totals come from the league_player_stats materialized view
+    # (refreshed when a round's performances are stored). If the view hasn't
+    # been created yet, or has no rows for this league, aggregate
+    # player_performances directly.
     # For simulated data: use league_id directly (no matches table)
     # For real data: would join with matches table
+    stats_view_query = text("""
+        SELECT player_id, total_runs, total_wickets, total_catches,
+               total_balls, total_overs, total_runs_conceded
+        FROM league_player_stats
+        WHERE league_id = :league_id
+    """)
     perf_query = text("""
         SELECT pp.player_id,
                SUM(pp.runs) as total_runs,
@@ -707,7 +744,14 @@ async def get_league_stats(
     """)
 
     try:
-        perf_results = db.execute(perf_query, {'league_id': league_id})
+        try:
+            perf_results = db.execute(stats_view_query, {'league_id': league_id}).all()
+        except ProgrammingError:
+            db.rollback()
+            perf_results = None
+        if not perf_results:
+            # View missing, or not refreshed since this league's rows were written
+            perf_results = db.execute(perf_query, {'league_id': league_id})
 
         for row in perf_results:
             player_stats_agg[row.player_id] = {
@@ -892,7 +936,7 @@ async def get_league_stats(
     }
 
 @app.get("/api/leagues/{league_id}/all-players")
-async def get_all_league_players(
+def get_all_league_players(
     league_id: str,
     role: str = None,  # Filter by role: BATSMAN, BOWLER, ALL-ROUNDER, WK-BATSMAN
     sort_by: str = "total_points",  # Sort by: total_points, runs, wickets, ownership
@@ -1040,7 +1084,7 @@ async def get_all_league_players(
     return players
 
 @app.get("/api/leagues/{league_id}/team-analysis")
-async def get_team_analysis(
+def get_team_analysis(
     league_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1165,7 +1209,7 @@ async def get_team_analysis(
 
 # Weekly update endpoints
 @app.post("/api/leagues/{league_id}/admin/trigger-weekly-update")
-async def trigger_weekly_update(
+def trigger_weekly_update(
     league_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -0,0 +1,11 @@
+-- Migration: Composite (user_id, league_id) index on fantasy_teams
+-- Purpose: Serve per-user lookups (my teams, leagues already joined) with index-only scans
+-- Date: 2026-10-17
+
+-- uq_league_user (league_id, user_id) leads with league_id, so it can't serve
+-- "all teams for this user"; this index can, and also covers league_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fantasy_team_user_league
+    ON fantasy_teams(user_id, league_id);
+
+-- The single-column user_id index is now a prefix of the composite one
+DROP INDEX CONCURRENTLY IF EXISTS idx_fantasy_team_user;
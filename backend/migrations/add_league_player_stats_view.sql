@@ -0,0 +1,24 @@
+-- Migration: Materialized per-league player totals
+-- Purpose: Serve /api/leagues/{id}/stats from precomputed sums instead of
+--          aggregating player_performances on every request
+-- Date: 2026-10-17
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS league_player_stats AS
+SELECT pp.league_id,
+       pp.player_id,
+       SUM(pp.runs) AS total_runs,
+       SUM(pp.wickets) AS total_wickets,
+       SUM(pp.catches) AS total_catches,
+       SUM(pp.balls_faced) AS total_balls,
+       SUM(pp.overs_bowled) AS total_overs,
+       SUM(pp.runs_conceded) AS total_runs_conceded
+FROM player_performances pp
+WHERE pp.league_id IS NOT NULL
+GROUP BY pp.league_id, pp.player_id;
+
+-- Unique index: lookups by league, and required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_league_player_stats_league_player
+    ON league_player_stats(league_id, player_id);
+
+-- Refreshed by scrape_weekly_real_data.py after storing a round:
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY league_player_stats;
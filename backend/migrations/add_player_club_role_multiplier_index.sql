@@ -0,0 +1,7 @@
+-- Migration: Add composite index on players(club_id, role, multiplier)
+-- Purpose: Serve the admin club player list filters (role, multiplier range) from an index range scan
+-- Date: 2026-10-17
+
+-- CONCURRENTLY avoids locking the players table; run outside a transaction block
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_player_club_role_multiplier
+    ON players(club_id, role, multiplier);
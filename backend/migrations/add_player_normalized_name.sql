@@ -0,0 +1,12 @@
+-- Migration: Add generated normalized_name column to players
+-- Purpose: Let duplicate player detection group by name in Postgres instead of in Python
+-- Date: 2026-10-17
+
+-- Stored generated column: lowercase name with spaces removed
+ALTER TABLE players
+    ADD COLUMN IF NOT EXISTS normalized_name VARCHAR(200)
+    GENERATED ALWAYS AS (lower(replace(name, ' ', ''))) STORED;
+
+-- CONCURRENTLY avoids locking the players table; run outside a transaction block
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_player_club_normalized_name
+    ON players(club_id, normalized_name);
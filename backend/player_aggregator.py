@@ -14,12 +14,31 @@ This module:
 from typing import Dict, List, Optional
 from datetime import datetime
 from collections import defaultdict
-import json
+from itertools import islice
+import hashlib
+import heapq
 import logging
+import os
+import msgpack
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sort keys for get_top_players
+TOP_PLAYER_SORT_KEYS = {
+    'fantasy_points': lambda p: p['season_totals']['fantasy_points'],
+    'runs': lambda p: p['season_totals']['batting']['runs'],
+    'wickets': lambda p: p['season_totals']['bowling']['wickets'],
+    'average': lambda p: p['averages']['batting_average'],
+    'strike_rate': lambda p: p['averages']['strike_rate'],
+    'matches': lambda p: len(p['match_history'])
+}
+
+# Binary aggregate files start with an 8-byte header: magic + format version
+AGGREGATES_MAGIC = b"FCAG"
+AGGREGATES_VERSION = 1
+
 
 class PlayerSeasonAggregator:
     """Aggregates player performances across a season"""
@@ -28,6 +47,7 @@ class PlayerSeasonAggregator:
         # In-memory storage (replace with database in production)
         self.players = {}  # player_id -> player data
         self.club_rosters = defaultdict(set)  # club_name -> set of player_ids
+        self.legacy_manifest = None  # hash of the legacy roster files already imported
 
     def add_match_performance(self, performance: Dict) -> Dict:
         """
@@ -40,19 +60,77 @@ class PlayerSeasonAggregator:
             Updated player season data
         """
         player_name = performance['player_name']
-        player_id_from_scrape = performance.get('player_id')
-        club = performance['club']
-        match_id = performance['match_id']
 
         # Try to match with existing player (including legacy imports)
-        player_id = self._find_or_create_player(player_name, player_id_from_scrape, club)
+        player_id = self._find_or_create_player(
+            player_name, performance.get('player_id'), performance['club']
+        )
 
         player_data = self.players[player_id]
 
+        if self._apply_performance(player_data, performance):
+            # Update metadata
+            player_data['last_updated'] = datetime.now().isoformat()
+            player_data['matches_played'] = len(player_data['match_history'])
+
+            logger.info(f"✅ Updated {player_name}: {player_data['season_totals']['fantasy_points']} points total")
+
+        return player_data
+
+    def add_batch(self, performances: List[Dict]) -> Dict[str, int]:
+        """
+        Add a batch of match performances (e.g. one weekly scrape)
+
+        Performances are grouped per scraped player, so each player is
+        matched (including the fuzzy name search) and has its metadata
+        updated once per batch rather than once per performance.
+
+        Args:
+            performances: Match performance dicts from scraper
+
+        Returns:
+            Dict with counts of 'new_players' and 'updated_players'
+        """
+        existing_ids = frozenset(self.players)
+
+        grouped = defaultdict(list)
+        for performance in performances:
+            key = (performance['player_name'], performance.get('player_id'), performance['club'])
+            grouped[key].append(performance)
+
+        touched_ids = set()
+        now = datetime.now().isoformat()
+        for (player_name, player_id_from_scrape, club), player_performances in grouped.items():
+            player_id = self._find_or_create_player(player_name, player_id_from_scrape, club)
+            touched_ids.add(player_id)
+            player_data = self.players[player_id]
+
+            applied = [self._apply_performance(player_data, p) for p in player_performances]
+            if any(applied):
+                player_data['last_updated'] = now
+                player_data['matches_played'] = len(player_data['match_history'])
+                # Per-player detail only at DEBUG; the caller logs a batch summary
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"✅ Updated {player_name}: {player_data['season_totals']['fantasy_points']} points total")
+
+        return {
+            'new_players': len(touched_ids - existing_ids),
+            'updated_players': len(touched_ids & existing_ids)
+        }
+
+    def _apply_performance(self, player_data: Dict, performance: Dict) -> bool:
+        """
+        Add one performance to a player's history and season totals
+
+        Returns:
+            False if the match was already processed for this player
+        """
+        match_id = performance['match_id']
+
         # Check if we already processed this match (idempotency)
         if match_id in player_data['processed_matches']:
-            logger.debug(f"⏭️  Match {match_id} already processed for {player_name}")
-            return player_data
+            logger.debug(f"⏭️  Match {match_id} already processed for {player_data['player_name']}")
+            return False
 
         # Add this performance to history
         match_performance = {
@@ -72,13 +150,7 @@ class PlayerSeasonAggregator:
         # Update season aggregates
         self._update_season_totals(player_data, match_performance)
 
-        # Update metadata
-        player_data['last_updated'] = datetime.now().isoformat()
-        player_data['matches_played'] = len(player_data['match_history'])
-
-        logger.info(f"✅ Updated {player_name}: {player_data['season_totals']['fantasy_points']} points total")
-
-        return player_data
+        return True
 
     def _find_or_create_player(self, player_name: str, player_id: Optional[str], club: str) -> str:
         """
@@ -368,9 +440,9 @@ class PlayerSeasonAggregator:
         """Get player data by ID"""
         return self.players.get(player_id)
 
-    def get_players_by_club(self, club: str) -> List[Dict]:
-        """Get all players for a specific club"""
-        player_ids = self.club_rosters.get(club, set())
+    def get_players_by_club(self, club: str, limit: Optional[int] = None) -> List[Dict]:
+        """Get players for a specific club (at most limit, if given)"""
+        player_ids = islice(self.club_rosters.get(club, set()), limit)
         return [self.players[pid] for pid in player_ids]
 
     def get_top_players(self, limit: int = 10, sort_by: str = 'fantasy_points') -> List[Dict]:
@@ -384,22 +456,11 @@ class PlayerSeasonAggregator:
         Returns:
             List of top players
         """
-        players_list = list(self.players.values())
-
-        # Define sort keys
-        sort_keys = {
-            'fantasy_points': lambda p: p['season_totals']['fantasy_points'],
-            'runs': lambda p: p['season_totals']['batting']['runs'],
-            'wickets': lambda p: p['season_totals']['bowling']['wickets'],
-            'average': lambda p: p['averages']['batting_average'],
-            'strike_rate': lambda p: p['averages']['strike_rate'],
-            'matches': lambda p: len(p['match_history'])
-        }
+        sort_key = TOP_PLAYER_SORT_KEYS.get(sort_by, TOP_PLAYER_SORT_KEYS['fantasy_points'])
 
-        sort_key = sort_keys.get(sort_by, sort_keys['fantasy_points'])
-        sorted_players = sorted(players_list, key=sort_key, reverse=True)
-
-        return sorted_players[:limit]
+        # Bounded heap selection: O(n log limit) and no full sorted copy,
+        # same order as sorted(..., reverse=True)[:limit]
+        return heapq.nlargest(limit, self.players.values(), key=sort_key)
 
     def get_season_summary(self) -> Dict:
         """Get summary of entire season"""
@@ -437,34 +498,58 @@ class PlayerSeasonAggregator:
         """Save aggregated data to JSON file"""
         export_data = self.export_to_database_format()
 
-        with open(filename, 'w') as f:
-            json.dump({
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps({
                 'saved_at': datetime.now().isoformat(),
                 'summary': self.get_season_summary(),
+                'legacy_manifest': self.legacy_manifest,
                 'players': export_data
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         logger.info(f"💾 Saved {len(export_data)} players to {filename}")
 
-    def load_from_file(self, filename: str = 'season_aggregates.json'):
-        """Load previously saved aggregated data"""
-        try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+    def save_to_msgpack(self, filename: str = 'season_aggregates.msgpack') -> str:
+        """
+        Save aggregated data as a versioned msgpack file
 
-            players_data = data.get('players', [])
+        Much smaller and faster to write/read than the JSON export. The file
+        is written alongside and swapped in with os.replace, so readers never
+        see a partial file. It carries no save timestamp (the file's mtime
+        serves), so unchanged data produces an identical file.
 
-            for player_data in players_data:
-                # Convert lists back to sets
-                player_data['processed_matches'] = set(player_data['processed_matches'])
+        Returns:
+            Hex digest of the file contents
+        """
+        export_data = self.export_to_database_format()
+        payload = msgpack.packb({
+            'legacy_manifest': self.legacy_manifest,
+            'players': export_data
+        }, use_bin_type=True)
 
-                player_id = player_data['player_id']
-                club = player_data['club']
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'wb') as f:
+            f.write(AGGREGATES_MAGIC + AGGREGATES_VERSION.to_bytes(4, 'little'))
+            f.write(payload)
+        os.replace(tmp_filename, filename)
 
-                self.players[player_id] = player_data
-                self.club_rosters[club].add(player_id)
+        logger.info(f"💾 Saved {len(export_data)} players to {filename}")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-            logger.info(f"✅ Loaded {len(players_data)} players from {filename}")
+    def load_from_msgpack(self, filename: str = 'season_aggregates.msgpack'):
+        """Load aggregated data saved by save_to_msgpack"""
+        try:
+            with open(filename, 'rb') as f:
+                header = f.read(8)
+                if header[:4] != AGGREGATES_MAGIC:
+                    raise ValueError(f"{filename} is not a season aggregates file")
+                version = int.from_bytes(header[4:], 'little')
+                if version != AGGREGATES_VERSION:
+                    raise ValueError(f"Unsupported season aggregates version {version}")
+                data = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+
+            count = self._load_players(data.get('players', []))
+            self.legacy_manifest = data.get('legacy_manifest')
+            logger.info(f"✅ Loaded {count} players from {filename}")
             return True
 
         except FileNotFoundError:
@@ -474,6 +559,38 @@ class PlayerSeasonAggregator:
             logger.error(f"❌ Error loading data: {e}")
             return False
 
+    def load_from_file(self, filename: str = 'season_aggregates.json'):
+        """Load previously saved aggregated data"""
+        try:
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read())
+
+            count = self._load_players(data.get('players', []))
+            self.legacy_manifest = data.get('legacy_manifest')
+            logger.info(f"✅ Loaded {count} players from {filename}")
+            return True
+
+        except FileNotFoundError:
+            logger.warning(f"⚠️  No saved data found at {filename}")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Error loading data: {e}")
+            return False
+
+    def _load_players(self, players_data: List[Dict]) -> int:
+        """Register exported player dicts, returning how many were loaded"""
+        for player_data in players_data:
+            # Convert lists back to sets
+            player_data['processed_matches'] = set(player_data['processed_matches'])
+
+            player_id = player_data['player_id']
+            club = player_data['club']
+
+            self.players[player_id] = player_data
+            self.club_rosters[club].add(player_id)
+
+        return len(players_data)
+
 
 # =============================================================================
 # TESTING
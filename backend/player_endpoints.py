@@ -10,7 +10,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 from database import get_db
 from database_models import Player, Club, Team
-from admin_endpoints import verify_admin
+from admin_endpoints import verify_admin, invalidate_player_cache
 import csv
 import io
 import uuid
@@ -48,7 +48,7 @@ class PlayerCreate(BaseModel):
 # =============================================================================
 
 @router.post("/players", status_code=status.HTTP_201_CREATED)
-async def create_player(
+def create_player(
     player_data: PlayerCreate,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
@@ -89,6 +89,7 @@ async def create_player(
 
     db.add(player)
     db.commit()
+    invalidate_player_cache()
     db.refresh(player)
 
     return {
@@ -291,6 +292,7 @@ async def create_players_bulk(
     # Commit all changes
     if created_count > 0 or updated_count > 0:
         db.commit()
+        invalidate_player_cache()
 
     return {
         "message": f"Bulk upload completed: {created_count} created, {updated_count} updated, {skipped_count} skipped",
@@ -309,7 +311,7 @@ async def create_players_bulk(
 # =============================================================================
 
 @router.get("/players/quality-check")
-async def player_quality_check(
+def player_quality_check(
     club_id: Optional[str] = None,
     admin: dict = Depends(verify_admin),
     db: Session = Depends(get_db)
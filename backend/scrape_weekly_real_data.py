@@ -25,6 +25,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 
 # Import our modules
+from database import refresh_league_player_stats
 from kncb_html_scraper import KNCBMatchCentreScraper
 from scorecard_player_matcher import ScorecardPlayerMatcher
 
@@ -404,6 +405,9 @@ def store_player_performances(
         stored_count += 1
 
     session.commit()
+
+    # Per-league totals served by the league stats endpoint
+    refresh_league_player_stats(session)
     return stored_count
 
 
@@ -9,9 +9,10 @@ import json
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
-from database_models import Season, Club, Team, Player, PlayerPriceHistory
+from database_models import Season, Club, Team, Player, PlayerPriceHistory, generate_uuid
 from player_value_calculator import PlayerValueCalculator
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,20 @@ class SeasonSetupService:
         "social": 1.3
     }
 
+    # Legacy roster team names -> database team names
+    LEGACY_TEAM_NAME_MAP = {
+        "ACC U17": "U17",
+        "ACC U15": "U15",
+        "ACC U13": "U13",
+        "ACC ZAMI": "ZAMI 1",  # Default to ZAMI 1
+        "ACC 1": "ACC 1",
+        "ACC 2": "ACC 2",
+        "ACC 3": "ACC 3",
+        "ACC 4": "ACC 4",
+        "ACC 5": "ACC 5",
+        "ACC 6": "ACC 6"
+    }
+
     def __init__(self, db: Session):
         self.db = db
         self.value_calculator = PlayerValueCalculator()
@@ -115,7 +130,7 @@ class SeasonSetupService:
         })
 
         # Activate this season
-        season = self.db.query(Season).filter_by(id=season_id).first()
+        season = self.db.get(Season, season_id)
         if not season:
             raise ValueError(f"Season {season_id} not found")
 
@@ -197,7 +212,7 @@ class SeasonSetupService:
         """
         logger.info(f"Creating teams for club {club_id}")
 
-        club = self.db.query(Club).filter_by(id=club_id).first()
+        club = self.db.get(Club, club_id)
         if not club:
             raise ValueError(f"Club {club_id} not found")
 
@@ -254,7 +269,7 @@ class SeasonSetupService:
             roster_data = json.load(f)
 
         # Get club
-        club = self.db.query(Club).filter_by(id=club_id).first()
+        club = self.db.get(Club, club_id)
         if not club:
             raise ValueError(f"Club {club_id} not found")
 
@@ -269,98 +284,90 @@ class SeasonSetupService:
             for team in created_teams:
                 teams_by_name[team.name] = team
 
-        # Load players
-        players_loaded = 0
+        # Existing names for this club in one query, instead of one per player
+        existing_names = {
+            name for (name,) in self.db.query(Player.name).filter(Player.club_id == club_id)
+        }
+
+        # Build all rows up front and insert them in one statement each.
+        # IDs are generated here so price history rows can reference them
+        # without a flush per player.
+        now = datetime.utcnow()
+        player_rows = []
+        price_history_rows = []
         players_skipped = 0
-        total_value = 0.0
 
         for player_data in roster_data.get('players', []):
-            try:
-                # Check if player already exists
-                existing = self.db.query(Player).filter_by(
-                    club_id=club_id,
-                    name=player_data['name']
-                ).first()
-
-                if existing:
-                    logger.debug(f"   Skipping existing player: {player_data['name']}")
-                    players_skipped += 1
-                    continue
-
-                # Get team by mapping team_name from JSON
-                team_name_raw = player_data.get('team_name', 'ACC 1')
-
-                # Normalize team name (e.g., "ACC U17" -> "U17", "ACC 3" -> "ACC 3", "ACC ZAMI" -> "ZAMI 1")
-                # Map team names from JSON to database team names
-                team_name_map = {
-                    "ACC U17": "U17",
-                    "ACC U15": "U15",
-                    "ACC U13": "U13",
-                    "ACC ZAMI": "ZAMI 1",  # Default to ZAMI 1
-                    "ACC 1": "ACC 1",
-                    "ACC 2": "ACC 2",
-                    "ACC 3": "ACC 3",
-                    "ACC 4": "ACC 4",
-                    "ACC 5": "ACC 5",
-                    "ACC 6": "ACC 6"
-                }
-
-                team_name = team_name_map.get(team_name_raw, team_name_raw)
-                team = teams_by_name.get(team_name)
-
-                if not team:
-                    # Try without club prefix
-                    for t_name, t_obj in teams_by_name.items():
-                        if team_name_raw.endswith(t_name) or t_name in team_name_raw:
-                            team = t_obj
-                            break
-
-                if not team:
-                    logger.warning(f"   No team found for {team_name_raw}, skipping player {player_data['name']}")
-                    players_skipped += 1
-                    continue
-
-                # Get multiplier from legacy data (range: 0.69-5.0, with 1.0 = median)
-                # Lower multiplier = better player but points are multiplied by less
-                # Higher multiplier = worse player but points are multiplied by more
-                multiplier = player_data.get('multiplier', 1.0)
-
-                # Create player
-                player = Player(
-                    club_id=club_id,
-                    team_id=team.id,
-                    name=player_data['name'],
-                    multiplier=multiplier,
-                    multiplier_updated_at=datetime.utcnow(),
-                    fantasy_value=25.0,  # Deprecated, not used in multiplier system
-                    stats=player_data.get('stats', {}),
-                    is_wicket_keeper=player_data.get('is_wicket_keeper', False),
-                    legacy_player_id=player_data.get('player_id'),
-                    value_calculation_date=datetime.utcnow(),
-                    value_manually_adjusted=False
-                )
-
-                self.db.add(player)
-                self.db.flush()  # Flush to get player.id
-
-                # Create price history entry
-                price_history = PlayerPriceHistory(
-                    player_id=player.id,
-                    old_value=0.0,
-                    new_value=player.fantasy_value,
-                    change_reason="initial",
-                    reason_details="Loaded from legacy roster"
-                )
-                self.db.add(price_history)
-
-                players_loaded += 1
-                total_value += player.fantasy_value
-
-            except Exception as e:
-                logger.error(f"   Error loading player {player_data.get('name')}: {e}")
+            name = player_data.get('name')
+            if not name:
+                logger.error(f"   Error loading player without a name: {player_data}")
                 players_skipped += 1
+                continue
 
-        self.db.flush()
+            if name in existing_names:
+                logger.debug(f"   Skipping existing player: {name}")
+                players_skipped += 1
+                continue
+
+            # Get team by mapping team_name from JSON
+            team_name_raw = player_data.get('team_name', 'ACC 1')
+            team_name = self.LEGACY_TEAM_NAME_MAP.get(team_name_raw, team_name_raw)
+            team = teams_by_name.get(team_name)
+
+            if not team:
+                # Try without club prefix
+                for t_name, t_obj in teams_by_name.items():
+                    if team_name_raw.endswith(t_name) or t_name in team_name_raw:
+                        team = t_obj
+                        break
+
+            if not team:
+                logger.warning(f"   No team found for {team_name_raw}, skipping player {name}")
+                players_skipped += 1
+                continue
+
+            # Get multiplier from legacy data (range: 0.69-5.0, with 1.0 = median)
+            # Lower multiplier = better player but points are multiplied by less
+            # Higher multiplier = worse player but points are multiplied by more
+            multiplier = player_data.get('multiplier', 1.0)
+            price = player_data.get('base_price', 100)
+
+            if player_data.get('is_wicket_keeper', False):
+                role = "WICKET_KEEPER"
+            else:
+                role = player_data.get('role', "ALL_ROUNDER")
+
+            player_id = generate_uuid()
+            player_rows.append({
+                "id": player_id,
+                "club_id": club_id,
+                "name": name,
+                "rl_team": team.name,
+                "role": role,
+                "tier": player_data.get('tier', "HOOFDKLASSE"),
+                "base_price": price,
+                "current_price": price,
+                "multiplier": multiplier,
+                "starting_multiplier": multiplier,
+                "multiplier_updated_at": now,
+                "is_active": True,
+                "created_at": now
+            })
+            price_history_rows.append({
+                "player_id": player_id,
+                "old_value": 0.0,
+                "new_value": price,
+                "change_reason": "initial",
+                "reason_details": "Loaded from legacy roster"
+            })
+            existing_names.add(name)
+
+        if player_rows:
+            self.db.execute(insert(Player), player_rows)
+            self.db.execute(insert(PlayerPriceHistory), price_history_rows)
+
+        players_loaded = len(player_rows)
+        total_value = float(sum(row["current_price"] for row in player_rows))
 
         avg_value = total_value / players_loaded if players_loaded > 0 else 0
 
@@ -404,7 +411,7 @@ class SeasonSetupService:
         Returns:
             Updated Player object
         """
-        player = self.db.query(Player).filter_by(id=player_id).first()
+        player = self.db.get(Player, player_id)
         if not player:
             raise ValueError(f"Player {player_id} not found")
 
@@ -432,6 +439,65 @@ class SeasonSetupService:
 
         return player
 
+    def bulk_update_player_values(
+        self,
+        updates: List[Dict],
+        changed_by: Optional[str] = None
+    ) -> Dict:
+        """
+        Update many players' values with set-based statements.
+
+        Reads the current prices in one SELECT, writes the new prices as a
+        single executemany UPDATE and records all price history rows in one
+        INSERT, instead of a round trip per player.
+
+        Args:
+            updates: Dicts with player_id, new_value and optional reason
+            changed_by: Admin user ID
+
+        Returns:
+            Dictionary with updated and missing player IDs
+        """
+        # Last update wins if a player appears more than once
+        by_player = {u["player_id"]: u for u in updates}
+
+        old_prices = dict(
+            self.db.query(Player.id, Player.current_price)
+            .filter(Player.id.in_(list(by_player)))
+            .all()
+        )
+        missing = [player_id for player_id in by_player if player_id not in old_prices]
+
+        found = [u for player_id, u in by_player.items() if player_id in old_prices]
+        # current_price is an Integer column; history records the same stored value
+        new_prices = {u["player_id"]: round(u["new_value"]) for u in found}
+        if found:
+            self.db.execute(
+                update(Player),
+                [{"id": player_id, "current_price": price} for player_id, price in new_prices.items()]
+            )
+            self.db.execute(
+                insert(PlayerPriceHistory),
+                [
+                    {
+                        "player_id": u["player_id"],
+                        "old_value": old_prices[u["player_id"]],
+                        "new_value": new_prices[u["player_id"]],
+                        "change_reason": "manual",
+                        "reason_details": u.get("reason") or "Bulk adjustment",
+                        "changed_by": changed_by
+                    }
+                    for u in found
+                ]
+            )
+
+        logger.info(f"✅ Bulk value update: {len(found)} updated, {len(missing)} not found")
+
+        return {
+            "updated": [u["player_id"] for u in found],
+            "missing": missing
+        }
+
     def add_player_manually(
         self,
         club_id: str,
@@ -456,7 +522,7 @@ class SeasonSetupService:
             Created Player object
         """
         # Get club and team
-        club = self.db.query(Club).filter_by(id=club_id).first()
+        club = self.db.get(Club, club_id)
         if not club:
             raise ValueError(f"Club {club_id} not found")
 
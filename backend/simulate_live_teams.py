@@ -17,6 +17,7 @@ import asyncio
 import os
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from database import refresh_league_player_stats
 from datetime import datetime
 import logging
 
@@ -517,6 +518,9 @@ def store_all_player_performances(weekly_performances, league_id, round_number=1
         session.commit()
         print(f"   ✅ Stored {total_stored} player performances (all players, not just fantasy teams)")
 
+        # Per-league totals served by the league stats endpoint
+        refresh_league_player_stats(session)
+
     except Exception as e:
         session.rollback()
         print(f"\n❌ Error storing all player performances: {e}")
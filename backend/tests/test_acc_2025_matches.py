@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for ACC 2025 Match Data
+==============================
+Sanity checks for the static 2025 match table and its lookup indexes.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from acc_2025_matches import (
+    ALL_2025_MATCHES, MATCHES_BY_ID, MATCHES_BY_TEAM,
+    MATCH_IDS, MATCH_TEAMS, MATCH_COUNTS, TOTAL_MATCHES, url_of
+)
+
+
+def test_total_matches():
+    """Test that the summary constants agree with the 2025 season"""
+    assert TOTAL_MATCHES == 136
+    assert sum(MATCH_COUNTS.values()) == TOTAL_MATCHES
+    assert MATCH_COUNTS['ACC 1'] == 18
+    assert MATCH_COUNTS['ACC 5'] == 13
+
+
+def test_match_ids_unique():
+    """Test that every match appears once in the id index"""
+    assert len(MATCHES_BY_ID) == TOTAL_MATCHES
+    assert MATCH_IDS == tuple(m['match_id'] for m in ALL_2025_MATCHES)
+
+
+def test_matches_by_team():
+    """Test that team groups match the per-team counts"""
+    assert {team: len(matches) for team, matches in MATCHES_BY_TEAM.items()} == MATCH_COUNTS
+    assert set(MATCH_TEAMS) == set(MATCH_COUNTS)
+
+    for team, matches in MATCHES_BY_TEAM.items():
+        assert all(m['team'] == team for m in matches)
+
+
+def test_records_are_read_only():
+    """Test that shared match records can't be mutated"""
+    match = MATCHES_BY_ID[7254567]
+    assert match['team'] == 'ACC 1'
+
+    with pytest.raises(TypeError):
+        match['team'] = 'ACC 2'
+
+
+def test_url_of():
+    """Test that scorecard URLs are rebuilt from match id and period"""
+    match = MATCHES_BY_ID[7254567]
+    assert url_of(match) == 'https://matchcentre.kncb.nl/match/134453-7254567/scorecard/?period=2821921'
@@ -10,12 +10,16 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime, timedelta
+import base64
 import bcrypt
+import hashlib
+import hmac
 import os
 import re
 import redis
 import requests
-from jose import jwt, JWTError
+import jwt
+from passlib.context import CryptContext
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
@@ -34,6 +38,15 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Password hashing is bcrypt. A short-lived build hashed with scrypt
+# ("scrypt$n$r$p$salt$hash"); those hashes still verify and are rewritten
+# as bcrypt on the next successful login.
+SCRYPT_PREFIX = "scrypt"
+SCRYPT_MAXMEM = 64 * 1024 * 1024
+
+# Verifier for legacy passlib hashes, built once rather than per login
+legacy_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 # Turnstile configuration
 TURNSTILE_SECRET_KEY = os.getenv("TURNSTILE_SECRET_KEY", "")
 
@@ -74,17 +87,32 @@ def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True for scrypt hashes, which are moved back to bcrypt on login"""
+    return hashed_password.startswith(f"{SCRYPT_PREFIX}$")
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash - supports both bcrypt and passlib formats"""
+    """Verify a password against its hash - supports scrypt, bcrypt and passlib formats"""
+    if hashed_password.startswith(f"{SCRYPT_PREFIX}$"):
+        try:
+            _, n, r, p, salt, digest = hashed_password.split("$")
+            expected = base64.b64decode(digest)
+            actual = hashlib.scrypt(
+                plain_password.encode('utf-8'), salt=base64.b64decode(salt),
+                n=int(n), r=int(r), p=int(p), maxmem=SCRYPT_MAXMEM, dklen=len(expected)
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
     try:
         # Try bcrypt verification first (new format)
         return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
     except (ValueError, AttributeError):
         # Fall back to passlib for legacy passwords
         try:
-            from passlib.context import CryptContext
-            pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-            return pwd_context.verify(plain_password, hashed_password)
+            return legacy_pwd_context.verify(plain_password, hashed_password)
         except:
             return False
 
@@ -221,7 +249,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired"
         )
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
@@ -233,7 +261,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
 # =============================================================================
 
 @router.post("/register", status_code=status.HTTP_201_CREATED, response_model=TokenResponse)
-async def register(user_data: UserRegister, request: Request, db: Session = Depends(get_db)):
+def register(user_data: UserRegister, request: Request, db: Session = Depends(get_db)):
     """Register a new user account"""
 
     # Verify Turnstile token
@@ -294,7 +322,7 @@ async def register(user_data: UserRegister, request: Request, db: Session = Depe
 
 @router.post("/login", response_model=TokenResponse)
 @limiter.limit("5/minute")  # Only 5 login attempts per minute per IP
-async def login(request: Request, credentials: UserLogin, db: Session = Depends(get_db)):
+def login(request: Request, credentials: UserLogin, db: Session = Depends(get_db)):
     """Login with email and password"""
 
     # Verify Turnstile token
@@ -343,6 +371,10 @@ async def login(request: Request, credentials: UserLogin, db: Session = Depends(
     # Clear failed login attempts on successful login
     clear_failed_logins(email_lower)
 
+    # Rewrite scrypt hashes as bcrypt now that we have the plain password
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(credentials.password)
+
     # Update last login
     user.last_login = datetime.utcnow()
     db.commit()
@@ -365,7 +397,7 @@ async def login(request: Request, credentials: UserLogin, db: Session = Depends(
 
 
 @router.get("/me")
-async def get_current_user(
+def get_current_user(
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -391,7 +423,7 @@ async def get_current_user(
 
 
 @router.post("/toggle-mode")
-async def toggle_admin_mode(
+def toggle_admin_mode(
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
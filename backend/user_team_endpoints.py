@@ -5,11 +5,12 @@ User-facing endpoints for joining leagues, creating teams, and managing players
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, select, inspect as sa_inspect
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Tuple
-from database import get_db
-from database_models import League, Season, FantasyTeam, FantasyTeamPlayer, Player, Team, LeagueRoster
+from database import get_db, default_query_options
+from database_models import League, Season, Club, FantasyTeam, FantasyTeamPlayer, Player, Team, LeagueRoster
 from user_auth_endpoints import verify_token
 from collections import Counter
 import logging
@@ -18,6 +19,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/user", tags=["user_teams"])
 
+# Rows fetched per round trip when listing a league's available players
+AVAILABLE_PLAYERS_BATCH_SIZE = 500
+
 
 # =============================================================================
 # REQUEST/RESPONSE MODELS
@@ -73,8 +77,9 @@ def validate_league_rules(
         if not (player_to_remove_id and ftp.player_id == player_to_remove_id)
     ]
 
-    # Load all players at once
-    if player_ids and db:
+    # Load all players at once, unless the caller already eager-loaded them
+    players_loaded = all('player' not in sa_inspect(ftp).unloaded for ftp in current_players)
+    if player_ids and db and not players_loaded:
         players = db.query(Player).filter(Player.id.in_(player_ids)).all()
         proposed_squad = players
     else:
@@ -174,7 +179,7 @@ def validate_league_rules(
 # =============================================================================
 
 @router.get("/leagues/public")
-async def browse_public_leagues(
+def browse_public_leagues(
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -183,16 +188,25 @@ async def browse_public_leagues(
 
     Returns leagues the user hasn't joined yet
     """
-    # Get all public leagues
-    leagues = db.query(League).filter_by(is_public=True).all()
+    # Leagues the user already has a team in
+    user_league_ids = select(FantasyTeam.league_id).where(FantasyTeam.user_id == user["sub"])
+
+    # Participant count per league, computed once in SQL instead of loading
+    # every league's fantasy_teams collection
+    participants = (
+        db.query(FantasyTeam.league_id, func.count(FantasyTeam.id).label("participants_count"))
+        .group_by(FantasyTeam.league_id)
+        .subquery()
+    )
 
-    # Get user's current league memberships
-    user_league_ids = {
-        team.league_id
-        for team in db.query(FantasyTeam).filter_by(user_id=user["sub"]).all()
-    }
+    rows = (
+        db.query(League, func.coalesce(participants.c.participants_count, 0))
+        .outerjoin(participants, participants.c.league_id == League.id)
+        .options(*default_query_options(), joinedload(League.season), joinedload(League.club))
+        .filter(League.is_public == True, League.id.not_in(user_league_ids))
+        .all()
+    )
 
-    # Filter out leagues user has already joined
     available_leagues = [
         {
             "id": league.id,
@@ -201,21 +215,20 @@ async def browse_public_leagues(
             "season_name": league.season.name if league.season else "Unknown",
             "club_name": league.club.name if league.club else "Unknown",
             "league_code": league.league_code,
-            "participants_count": len(league.fantasy_teams),
+            "participants_count": participants_count,
             "max_participants": league.max_participants,
-            "is_full": len(league.fantasy_teams) >= league.max_participants,
+            "is_full": participants_count >= league.max_participants,
             "squad_size": league.squad_size,
             "transfers_per_season": league.transfers_per_season
         }
-        for league in leagues
-        if league.id not in user_league_ids
+        for league, participants_count in rows
     ]
 
     return {"leagues": available_leagues}
 
 
 @router.post("/leagues/join")
-async def join_league(
+def join_league(
     request: JoinLeagueByCode,
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -225,28 +238,42 @@ async def join_league(
 
     Creates a fantasy team entry for the user in the league
     """
-    # Find league by code
-    league = db.query(League).filter_by(league_code=request.league_code.upper()).first()
-    if not league:
+    # Find league by code, with its participant count and whether the user
+    # already has a team in it, in one round-trip
+    participants_count = (
+        select(func.count(FantasyTeam.id))
+        .where(FantasyTeam.league_id == League.id)
+        .scalar_subquery()
+        .label("participants_count")
+    )
+    has_team = exists().where(
+        FantasyTeam.league_id == League.id,
+        FantasyTeam.user_id == user["sub"]
+    ).label("has_team")
+
+    row = (
+        db.query(League, participants_count, has_team)
+        .options(joinedload(League.season), joinedload(League.club))
+        .filter(League.league_code == request.league_code.upper())
+        .first()
+    )
+    if row is None:
         raise HTTPException(
             status_code=404,
             detail="League not found. Please check the code and try again."
         )
 
+    league = row.League
+
     # Check if league is full
-    if len(league.fantasy_teams) >= league.max_participants:
+    if row.participants_count >= league.max_participants:
         raise HTTPException(
             status_code=400,
             detail="This league is full and cannot accept more participants."
         )
 
     # Check if user already joined this league
-    existing_team = db.query(FantasyTeam).filter_by(
-        league_id=league.id,
-        user_id=user["sub"]
-    ).first()
-
-    if existing_team:
+    if row.has_team:
         raise HTTPException(
             status_code=400,
             detail="You have already joined this league."
@@ -273,7 +300,7 @@ async def join_league(
 # =============================================================================
 
 @router.post("/teams", status_code=status.HTTP_201_CREATED)
-async def create_fantasy_team(
+def create_fantasy_team(
     team_data: CreateTeam,
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -283,30 +310,30 @@ async def create_fantasy_team(
 
     This happens after joining a league
     """
-    # Verify league exists
-    league = db.query(League).filter_by(id=team_data.league_id).first()
-    if not league:
+    # Load the league together with the "already has a team" and
+    # "team name taken" checks in a single round-trip
+    has_team = exists().where(
+        FantasyTeam.league_id == League.id,
+        FantasyTeam.user_id == user["sub"]
+    ).label("has_team")
+    name_taken = exists().where(
+        FantasyTeam.league_id == League.id,
+        FantasyTeam.team_name == team_data.team_name
+    ).label("name_taken")
+
+    row = db.query(League, has_team, name_taken).filter(League.id == team_data.league_id).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="League not found")
 
-    # Check if user already has a team in this league
-    existing_team = db.query(FantasyTeam).filter_by(
-        league_id=team_data.league_id,
-        user_id=user["sub"]
-    ).first()
+    league = row.League
 
-    if existing_team:
+    if row.has_team:
         raise HTTPException(
             status_code=400,
             detail="You already have a team in this league"
         )
 
-    # Check if team name is unique in league
-    name_taken = db.query(FantasyTeam).filter_by(
-        league_id=team_data.league_id,
-        team_name=team_data.team_name
-    ).first()
-
-    if name_taken:
+    if row.name_taken:
         raise HTTPException(
             status_code=400,
             detail="Team name is already taken in this league"
@@ -338,14 +365,21 @@ async def create_fantasy_team(
 
 
 @router.get("/teams")
-async def get_my_teams(
+def get_my_teams(
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
     """
     Get all fantasy teams for the current user
     """
-    teams = db.query(FantasyTeam).filter_by(user_id=user["sub"]).all()
+    # Count players in SQL and load the league/season/club in the same
+    # SELECT, so the per-team fields below never trigger lazy loads.
+    teams = db.query(FantasyTeam).options(
+        *default_query_options(),
+        undefer(FantasyTeam.player_count),
+        joinedload(FantasyTeam.league).joinedload(League.season),
+        joinedload(FantasyTeam.league).joinedload(League.club),
+    ).filter_by(user_id=user["sub"]).all()
 
     return {
         "teams": [
@@ -359,7 +393,7 @@ async def get_my_teams(
                 "total_points": team.total_points,
                 "rank": team.rank,
                 "is_finalized": team.is_finalized,
-                "players_count": len(team.players),
+                "players_count": team.player_count,
                 "budget_remaining": team.budget_remaining,
                 "budget_used": team.budget_used,
                 "transfers_used": team.transfers_used,
@@ -375,7 +409,7 @@ async def get_my_teams(
 
 
 @router.get("/teams/{team_id}")
-async def get_team_details(
+def get_team_details(
     team_id: str,
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -383,7 +417,13 @@ async def get_team_details(
     """
     Get detailed information about a specific team
     """
-    team = db.query(FantasyTeam).filter_by(id=team_id, user_id=user["sub"]).first()
+    team = db.query(FantasyTeam).options(
+        *default_query_options(),
+        selectinload(FantasyTeam.players)
+        .selectinload(FantasyTeamPlayer.player)
+        .joinedload(Player.club),
+        joinedload(FantasyTeam.league).joinedload(League.season),
+    ).filter_by(id=team_id, user_id=user["sub"]).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
@@ -438,7 +478,7 @@ async def get_team_details(
 # =============================================================================
 
 @router.get("/teams/{team_id}/available-players")
-async def get_available_players(
+def get_available_players(
     team_id: str,
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -446,7 +486,10 @@ async def get_available_players(
     """
     Get all players available for selection in a team's league
     """
-    team = db.query(FantasyTeam).filter_by(id=team_id, user_id=user["sub"]).first()
+    team = db.query(FantasyTeam).options(
+        undefer(FantasyTeam.player_count),
+        joinedload(FantasyTeam.league)
+    ).filter_by(id=team_id, user_id=user["sub"]).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
@@ -454,46 +497,61 @@ async def get_available_players(
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
 
-    # Get all players in this league's roster (via league_rosters junction table)
-    players = db.query(Player).join(
-        LeagueRoster,
-        Player.id == LeagueRoster.player_id
-    ).filter(
-        LeagueRoster.league_id == league.id
-    ).all()
-
-    # Get players already in this team
-    team_player_ids = {ftp.player_id for ftp in team.players}
-
-    # Return available players
-    available_players = []
-    for player in players:
-        if player.id not in team_player_ids:
-            available_players.append({
-                "id": player.id,
-                "name": player.name,
-                "club_name": player.club.name if player.club else "Unknown",
-                "team_name": player.rl_team if player.rl_team else "Unassigned",
-                "player_type": player.role.lower().replace('_', '-') if player.role else "unknown",
-                "is_wicket_keeper": player.role == "WICKET_KEEPER" if player.role else False,
-                "multiplier": player.multiplier if player.multiplier else 1.0,
-                "stats": {
-                    "matches": player.matches_played or 0,
-                    "runs": player.runs_scored or 0,
-                    "wickets": player.wickets_taken or 0,
-                    "catches": player.catches or 0
-                }
-            })
+    # Roster players not already in this team, as plain column rows: no
+    # Player objects, identity map entries or per-player club lookups
+    team_player_ids = select(FantasyTeamPlayer.player_id).where(
+        FantasyTeamPlayer.fantasy_team_id == team.id
+    )
+    rows = db.execute(
+        select(
+            Player.id,
+            Player.name,
+            Club.name.label("club_name"),
+            Player.rl_team,
+            Player.role,
+            Player.multiplier,
+            Player.matches_played,
+            Player.runs_scored,
+            Player.wickets_taken,
+            Player.catches
+        )
+        .join(LeagueRoster, Player.id == LeagueRoster.player_id)
+        .outerjoin(Club, Club.id == Player.club_id)
+        .where(
+            LeagueRoster.league_id == league.id,
+            Player.id.not_in(team_player_ids)
+        )
+        .execution_options(yield_per=AVAILABLE_PLAYERS_BATCH_SIZE)
+    )
+
+    available_players = [
+        {
+            "id": row.id,
+            "name": row.name,
+            "club_name": row.club_name or "Unknown",
+            "team_name": row.rl_team if row.rl_team else "Unassigned",
+            "player_type": row.role.lower().replace('_', '-') if row.role else "unknown",
+            "is_wicket_keeper": row.role == "WICKET_KEEPER" if row.role else False,
+            "multiplier": row.multiplier if row.multiplier else 1.0,
+            "stats": {
+                "matches": row.matches_played or 0,
+                "runs": row.runs_scored or 0,
+                "wickets": row.wickets_taken or 0,
+                "catches": row.catches or 0
+            }
+        }
+        for row in rows
+    ]
 
     return {
         "available_players": available_players,
-        "current_squad_size": len(team.players),
+        "current_squad_size": team.player_count,
         "max_squad_size": league.squad_size
     }
 
 
 @router.post("/teams/{team_id}/players")
-async def add_player_to_team(
+def add_player_to_team(
     team_id: str,
     request: AddPlayerToTeam,
     user: dict = Depends(verify_token),
@@ -601,7 +659,7 @@ async def add_player_to_team(
 
 
 @router.delete("/teams/{team_id}/players/{player_id}")
-async def remove_player_from_team(
+def remove_player_from_team(
     team_id: str,
     player_id: str,
     user: dict = Depends(verify_token),
@@ -643,7 +701,7 @@ async def remove_player_from_team(
 
 
 @router.post("/teams/{team_id}/finalize")
-async def finalize_team(
+def finalize_team(
     team_id: str,
     user: dict = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -653,7 +711,13 @@ async def finalize_team(
 
     Validates team composition before finalizing
     """
-    team = db.query(FantasyTeam).filter_by(id=team_id, user_id=user["sub"]).first()
+    # Squad rows, their players and the league in three queries, so the
+    # checks below and validate_league_rules work from loaded objects
+    team = db.query(FantasyTeam).options(
+        *default_query_options(),
+        selectinload(FantasyTeam.players).selectinload(FantasyTeamPlayer.player),
+        joinedload(FantasyTeam.league),
+    ).filter_by(id=team_id, user_id=user["sub"]).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
@@ -661,15 +725,23 @@ async def finalize_team(
         raise HTTPException(status_code=400, detail="Team is already finalized")
 
     league = team.league
+    squad_size = len(team.players)
+    captain_in_team = any(
+        ftp.player_id == team.captain_id and ftp.is_captain for ftp in team.players
+    )
+    vice_captain_in_team = any(
+        ftp.player_id == team.vice_captain_id and ftp.is_vice_captain for ftp in team.players
+    )
+    has_wicketkeeper = any(ftp.is_wicket_keeper for ftp in team.players)
 
     # Validate squad size
-    if len(team.players) != league.squad_size:
+    if squad_size != league.squad_size:
         raise HTTPException(
             status_code=400,
-            detail=f"Team must have exactly {league.squad_size} players (currently has {len(team.players)})"
+            detail=f"Team must have exactly {league.squad_size} players (currently has {squad_size})"
         )
 
-    # Comprehensive league rule validation
+    # Comprehensive league rule validation (reuses the players loaded above)
     is_valid, error_message = validate_league_rules(
         league=league,
         current_players=team.players,
@@ -691,10 +763,6 @@ async def finalize_team(
         )
 
     # Verify captain is in team
-    captain_in_team = any(
-        ftp.player_id == team.captain_id and ftp.is_captain
-        for ftp in team.players
-    )
     if not captain_in_team:
         raise HTTPException(
             status_code=400,
@@ -715,10 +783,6 @@ async def finalize_team(
             detail="Vice-captain must be different from captain"
         )
 
-    vice_captain_in_team = any(
-        ftp.player_id == team.vice_captain_id and ftp.is_vice_captain
-        for ftp in team.players
-    )
     if not vice_captain_in_team:
         raise HTTPException(
             status_code=400,
@@ -726,7 +790,6 @@ async def finalize_team(
         )
 
     # Validate at least one wicketkeeper is selected
-    has_wicketkeeper = any(ftp.is_wicket_keeper for ftp in team.players)
     if not has_wicketkeeper:
         raise HTTPException(
             status_code=400,
@@ -749,7 +812,7 @@ async def finalize_team(
 # =============================================================================
 
 @router.post("/teams/{team_id}/transfer")
-async def transfer_player(
+def transfer_player(
     team_id: str,
     request: TransferPlayer,
     user: dict = Depends(verify_token),
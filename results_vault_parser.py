@@ -6,20 +6,74 @@ Parse player statistics from KNCB ResultsVault API format
 """
 
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json (via response.json()) when orjson isn't installed
+    orjson = None
+
+try:
+    import brotli  # noqa: F401 - lets urllib3 decode "br" responses
+    ACCEPT_ENCODING = 'gzip, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    import ijson
+except ImportError:
+    # Without ijson the full response body is decoded up front
+    ijson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent player fetches; the default session pool is sized to match so
+# every worker keeps a reused connection
+MAX_WORKERS = 8
+
+
+def create_session(pool_maxsize: int = MAX_WORKERS) -> requests.Session:
+    """
+    Create a pooled HTTP session for the ResultsVault API
+
+    All player fetches hit the same host, so one keep-alive session
+    avoids a TCP + TLS handshake per request. Transient errors and
+    rate limiting (429/5xx) are retried by the adapter, and compressed
+    responses are requested since the JSON reports compress well.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    session.mount("https://", HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries
+    ))
+    session.headers.update({
+        'Accept': 'application/json',
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    })
+    return session
+
 
 class ResultsVaultParser:
     """Parse player data from ResultsVault API"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.base_url = "https://api.resultsvault.co.uk/rv"
         self.api_id = "1002"
+        self.session = session or create_session()
         
         # Fantasy points system
         self.points = {
@@ -198,17 +252,15 @@ class ResultsVaultParser:
         
         return max(0, points)
     
-    def parse_player_season(self, player_data: List[Dict]) -> Dict:
+    def parse_player_season(self, player_data: Iterable[Dict]) -> Dict:
         """
         Parse full season data for a player
         
-        Input: List of match performances from API
+        Input: Iterable of match performances from API (a list, or a
+               stream of items when the response is parsed with ijson)
         Output: Player summary with all matches and total points
         """
         
-        if not player_data:
-            return {}
-        
         # Parse all matches
         matches = []
         for match_data in player_data:
@@ -218,6 +270,9 @@ class ResultsVaultParser:
             perf['fantasy_points'] = self.calculate_fantasy_points(perf, tier)
             matches.append(perf)
         
+        if not matches:
+            return {}
+        
         # Calculate season totals
         total_runs = sum(
             m['batting']['runs'] for m in matches 
@@ -279,16 +334,120 @@ class ResultsVaultParser:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            return self.parse_player_season(data)
+            with self.session.get(url, params=params, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                logger.debug(f"Content-Encoding: {response.headers.get('Content-Encoding')}")
+                
+                if ijson:
+                    # Stream match items straight off the socket so the raw
+                    # API payload is never held in memory as a whole
+                    # (decode_content un-gzips before ijson sees the bytes)
+                    response.raw.decode_content = True
+                    data = ijson.items(response.raw, 'item', use_float=True)
+                else:
+                    data = orjson.loads(response.content) if orjson else response.json()
+                
+                return self.parse_player_season(data)
             
         except Exception as e:
             logger.error(f"Failed to fetch player data: {e}")
             return {}
     
+    def fetch_player_batch(self, player_ids: List[str], season_id: int = 19) -> Dict[str, Dict]:
+        """
+        Fetch several players' seasons with one comma-separated playerid
+
+        Match entries are grouped by their player_id and parsed per player.
+        Players the response doesn't include are simply absent from the
+        result, so callers can fall back to fetch_player_season for them.
+        """
+        url = f"{self.base_url}/0/report/rpt_plsml/"
+        params = {
+            'apiid': self.api_id,
+            'seasonid': season_id,
+            'playerid': ','.join(player_ids),
+            'sportid': 1,
+            'sort': '-DATE1'
+        }
+        
+        try:
+            response = self.session.get(url, params=params, timeout=15)
+            response.raise_for_status()
+            data = orjson.loads(response.content) if orjson else response.json()
+        except Exception as e:
+            logger.error(f"Failed to fetch player batch: {e}")
+            return {}
+        
+        by_player = {}
+        for match_data in data:
+            by_player.setdefault(str(match_data.get('player_id')), []).append(match_data)
+        
+        return {
+            player_id: self.parse_player_season(by_player[player_id])
+            for player_id in player_ids
+            if player_id in by_player
+        }
+    
+    def warm_up(self) -> None:
+        """
+        Open a connection to the API host ahead of a batch of fetches
+
+        Pays the DNS + TCP + TLS setup once up front so the first player
+        requests don't queue behind the handshake. Failures are ignored;
+        the real requests will surface any connectivity problem.
+        """
+        try:
+            self.session.head(self.base_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"ResultsVault warm-up failed: {e}")
+    
+    def fetch_player_seasons(
+        self,
+        player_ids: Iterable[str],
+        season_id: int = 19,
+        max_workers: int = MAX_WORKERS,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Dict]:
+        """
+        Fetch and parse season data for many players concurrently
+
+        Requests are I/O bound against a single host, so a bounded pool of
+        workers shares the pooled session instead of fetching one player
+        at a time. The session's pool_maxsize should be at least
+        max_workers to keep every worker on a reused connection.
+
+        With batch_size set, players are first requested batch_size at a
+        time via fetch_player_batch; any player missing from a batch
+        response (e.g. if the endpoint ignores extra ids) is then fetched
+        individually, so results are the same either way.
+
+        Returns:
+            Dict mapping player_id -> parsed season data ({} on failure)
+        """
+        player_ids = [str(pid) for pid in player_ids]
+        self.warm_up()
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if batch_size:
+                batches = [
+                    player_ids[i:i + batch_size]
+                    for i in range(0, len(player_ids), batch_size)
+                ]
+                for batch_result in executor.map(
+                    lambda batch: self.fetch_player_batch(batch, season_id=season_id),
+                    batches
+                ):
+                    results.update(batch_result)
+
+            remaining = [pid for pid in player_ids if pid not in results]
+            results.update(zip(remaining, executor.map(
+                lambda pid: self.fetch_player_season(pid, season_id=season_id),
+                remaining
+            )))
+
+        return {pid: results[pid] for pid in player_ids}
+    
     def suggest_player_price(self, season_stats: Dict, base_price: float = 20.0) -> float:
         """
         Suggest a fantasy price for a player based on their stats
@@ -341,7 +500,8 @@ def test_parser():
     print("🏏 Testing ResultsVault Parser")
     print("=" * 70)
     
-    parser = ResultsVaultParser()
+    session = create_session()
+    parser = ResultsVaultParser(session=session)
     
     # Fetch Sean Walsh's data
     print("\n1️⃣ Fetching player data...")
@@ -391,6 +551,7 @@ def test_parser():
     print("\n" + "=" * 70)
     print("✅ Parser test complete!")
     
+    session.close()
     return player_data
 
 